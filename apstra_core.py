@@ -5,15 +5,123 @@ import httpx
 import sys
 import json
 import os
+import time
+import atexit
+import asyncio
+import threading
+import functools
+import collections
+import random
+import ssl
+import socket
+import weakref
+import hashlib
+import contextlib
+from dataclasses import dataclass, field
 from logger_config import setup_logger
 
+# Optional C-accelerated JSON library; falls back to stdlib json when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional incremental JSON parser for the iter_* helpers; without it the
+# response is read and parsed in one go
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Set up logger
 logger = setup_logger(__name__, os.environ.get('LOG_LEVEL', 'INFO'))
 
+def _loads(content):
+    """Parse JSON from bytes or str, using orjson when available"""
+    return orjson.loads(content) if orjson else json.loads(content)
+
+# Results are consumed by an LLM over MCP, which does not need indentation;
+# compact output is smaller and faster to produce. Set APSTRA_MCP_PRETTY=1
+# for indented output when reading results by hand.
+_PRETTY = os.environ.get('APSTRA_MCP_PRETTY') == '1'
+
+def _encode_body(kwargs):
+    """Serialize a json= request body with orjson into content= bytes, when available"""
+    if orjson and 'json' in kwargs:
+        kwargs['content'] = orjson.dumps(kwargs.pop('json'))
+    return kwargs
+
+def _dumps(obj):
+    """Serialize to JSON text (compact unless APSTRA_MCP_PRETTY=1), using orjson when available"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if _PRETTY else 0).decode()
+    if _PRETTY:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# One SSL context for every session client; building a context loads the
+# default CA store, so it is done once per process rather than per client.
+# Apstra typically runs with a self-signed certificate, hence no verification.
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.check_hostname = False
+_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+# Disable Nagle's algorithm so small request bodies (login, writes) are sent
+# immediately instead of waiting for the previous segment's ACK
+_SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+# Transient failures are retried inside the session so they do not surface as
+# tool errors (and a fresh login/handshake on the next call). Connection
+# failures are retried by the httpx transport; read timeouts, dropped
+# connections and 502/503/504 responses are retried here with exponential
+# backoff and jitter, for read-only methods only (never POST/PUT, so writes
+# such as VN creation or deploy are not replayed). DELETE is not retried either:
+# after a gateway timeout the object may already be gone, and the retry would
+# turn a successful delete into a 404. HTTP 4xx is never retried.
+_TRANSPORT_RETRIES = 3
+_RETRY_ATTEMPTS = 3
+_RETRY_INITIAL_WAIT = 0.1
+_RETRY_MAX_WAIT = 2.0
+_RETRY_EXCEPTIONS = (httpx.ReadTimeout, httpx.RemoteProtocolError)
+_RETRY_STATUS_CODES = frozenset((502, 503, 504))
+_RETRY_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+
+def _retry_wait(attempt):
+    """Backoff before retry number attempt (0-based): exponential with jitter, capped"""
+    wait = _RETRY_INITIAL_WAIT * (2 ** attempt) + random.uniform(0, _RETRY_INITIAL_WAIT)
+    return min(wait, _RETRY_MAX_WAIT)
+
+# API paths, relative to the session base_url. Blueprint-scoped paths are
+# format-ready templates taking the blueprint ID.
+_PATH_LOGIN = '/api/user/login'
+_PATH_TEMPLATES = '/api/design/templates'
+_PATH_BLUEPRINTS = '/api/blueprints'
+_PATH_BLUEPRINT = '/api/blueprints/{}'
+_PATH_RACKS = '/api/blueprints/{}/racks'
+_PATH_RZ = '/api/blueprints/{}/security-zones'
+_PATH_VN = '/api/blueprints/{}/virtual-networks'
+_PATH_VN_BATCH = '/api/blueprints/{}/virtual-networks-batch?async=full'
+_PATH_CT = '/api/blueprints/{}/obj-policy-export'
+_PATH_CT_BATCH_APPLY = '/api/blueprints/{}/obj-policy-batch-apply?async=full'
+_PATH_APP_EP = '/api/blueprints/{}/obj-policy-application-points'
+_PATH_SYSTEM_INFO = '/api/blueprints/{}/experience/web/system-info'
+_PATH_DIFF_STATUS = '/api/blueprints/{}/diff-status'
+_PATH_DEPLOY = '/api/blueprints/{}/deploy'
+_PATH_ANOMALIES = '/api/blueprints/{}/anomalies'
+_PATH_REMOTE_GW = '/api/blueprints/{}/remote_gateways'
+_PATH_PROTOCOL_SESSIONS = '/api/blueprints/{}/protocol-sessions'
+
 # Helper function for formatting guidelines
-def get_formatting_guidelines():
-    """Returns comprehensive formatting guidelines for presenting network infrastructure data in tables with proper icons and structure."""
-    return """
+_FORMATTING_GUIDELINES = """
 # OUTPUT FORMATTING GUIDELINES
 
 When displaying network infrastructure information, always follow these formatting standards:
@@ -218,10 +326,12 @@ Reply with:
 This formatting ensures consistent, scannable, and actionable network infrastructure information while maintaining strict change control, verification, and deployment workflows.
 """
 
+def get_formatting_guidelines():
+    """Returns comprehensive formatting guidelines for presenting network infrastructure data in tables with proper icons and structure."""
+    return _FORMATTING_GUIDELINES
+
 # Modular guideline functions for targeted responses
-def get_base_guidelines():
-    """Returns base formatting guidelines with essential icons and structure."""
-    return """
+_BASE_GUIDELINES = """
 # OUTPUT FORMATTING GUIDELINES
 
 ## Status Icons Guide
@@ -237,9 +347,11 @@ def get_base_guidelines():
 3. **Notable Issues** if any exist
 """
 
-def get_device_guidelines():
-    """Returns device/system specific formatting guidelines."""
-    return """
+def get_base_guidelines():
+    """Returns base formatting guidelines with essential icons and structure."""
+    return _BASE_GUIDELINES
+
+_DEVICE_GUIDELINES = """
 ## Device Information Table Format
 | Status | Device Name | IP Address | Role | Model | OS Version |
 |--------|-------------|------------|------|-------|------------|
@@ -248,9 +360,11 @@ def get_device_guidelines():
 Include: ASN, Loopback IP, and other relevant device details as columns.
 """
 
-def get_network_guidelines():
-    """Returns network configuration formatting guidelines."""
-    return """
+def get_device_guidelines():
+    """Returns device/system specific formatting guidelines."""
+    return _DEVICE_GUIDELINES
+
+_NETWORK_GUIDELINES = """
 ## Network Configuration Display
 - **Virtual Networks**: Show VN name, ID, routing zone, VNI
 - **Routing Zones**: Display zone name, VRF, VNI range
@@ -259,9 +373,11 @@ def get_network_guidelines():
 Use tables for multiple items, structured JSON for single items.
 """
 
-def get_status_guidelines():
-    """Returns status and protocol session formatting guidelines."""
-    return """
+def get_network_guidelines():
+    """Returns network configuration formatting guidelines."""
+    return _NETWORK_GUIDELINES
+
+_STATUS_GUIDELINES = """
 ## Protocol Sessions Table
 | Status | Local | Remote | Type | State | Uptime |
 |--------|-------|--------|------|-------|--------|
@@ -273,9 +389,11 @@ def get_status_guidelines():
 - Display deployment history if relevant
 """
 
-def get_anomaly_guidelines():
-    """Returns anomaly and issue reporting guidelines."""
-    return """
+def get_status_guidelines():
+    """Returns status and protocol session formatting guidelines."""
+    return _STATUS_GUIDELINES
+
+_ANOMALY_GUIDELINES = """
 ## Anomaly Display Format
 | Severity | Device | Issue | Duration | Impact |
 |----------|--------|-------|----------|---------|
@@ -288,9 +406,11 @@ Severity Levels:
 - 🟢 **Info** - Informational only
 """
 
-def get_change_mgmt_guidelines():
-    """Returns change management and deployment guidelines."""
-    return """
+def get_anomaly_guidelines():
+    """Returns anomaly and issue reporting guidelines."""
+    return _ANOMALY_GUIDELINES
+
+_CHANGE_MGMT_GUIDELINES = """
 ## ⚠️ CRITICAL: Change Management Requirements
 
 **NEVER make changes without explicit user confirmation.**
@@ -310,9 +430,11 @@ Example prompt after changes:
 "Configuration changes made. Would you like to deploy? (yes/no)"
 """
 
-def get_auth_guidelines():
-    """Returns authentication-specific formatting guidelines."""
-    return """
+def get_change_mgmt_guidelines():
+    """Returns change management and deployment guidelines."""
+    return _CHANGE_MGMT_GUIDELINES
+
+_AUTH_GUIDELINES = """
 ## Authentication Response Format
 - Show session status clearly
 - Include expiration time if applicable
@@ -320,9 +442,11 @@ def get_auth_guidelines():
 - Indicate credential source
 """
 
-def get_blueprint_guidelines():
-    """Returns blueprint-specific formatting guidelines."""
-    return """
+def get_auth_guidelines():
+    """Returns authentication-specific formatting guidelines."""
+    return _AUTH_GUIDELINES
+
+_BLUEPRINT_GUIDELINES = """
 ## Blueprint Information Display
 | Status | Name | ID | Design | Version |
 |--------|------|----|---------|---------| 
@@ -331,314 +455,1132 @@ def get_blueprint_guidelines():
 Include creation date, last modified, and node count when available.
 """
 
-# Global configuration variables
+def get_blueprint_guidelines():
+    """Returns blueprint-specific formatting guidelines."""
+    return _BLUEPRINT_GUIDELINES
+
+# Guideline blocks prepended to MCP tool output, concatenated once at import
+# instead of on every tool call
+BLUEPRINT_GUIDELINES = _BASE_GUIDELINES + _BLUEPRINT_GUIDELINES
+DEVICE_GUIDELINES = _BASE_GUIDELINES + _DEVICE_GUIDELINES
+NETWORK_GUIDELINES = _BASE_GUIDELINES + _NETWORK_GUIDELINES
+ANOMALY_GUIDELINES = _BASE_GUIDELINES + _ANOMALY_GUIDELINES
+STATUS_GUIDELINES = _BASE_GUIDELINES + _STATUS_GUIDELINES
+CHANGE_MGMT_GUIDELINES = _BASE_GUIDELINES + _CHANGE_MGMT_GUIDELINES
+
+@dataclass(frozen=True, slots=True)
+class ApstraConfig:
+    """
+    Connection settings loaded from the config file.
+    
+    host is derived once from server and port as host:port (port 443 when neither
+    the server string nor the port field carries one).
+    """
+    server: str = ''
+    port: str = ''
+    username: str = ''
+    password: str = ''
+    host: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        if ':' in self.server:
+            host = self.server
+        elif self.port:
+            host = f"{self.server}:{self.port}"
+        else:
+            host = f"{self.server}:443"
+        object.__setattr__(self, 'host', host)
+    
+    @classmethod
+    def from_dict(cls, config):
+        """Build from a parsed config file, accepting the legacy aos_* field names"""
+        return cls(
+            server=config.get('server') or config.get('aos_server', ''),
+            port=config.get('port') or config.get('aos_port', ''),
+            username=config.get('username', ''),
+            password=config.get('password', '')
+        )
+
+# Active configuration, replaced as a whole by initialize_config(). None until
+# first needed, so importing the module does not touch the config file
+CONFIG = None
+
+# Global configuration variables (kept for backward compatibility; mirror CONFIG)
 server = ''
 port = ''
 username = ''
 password = ''
 
 # Load configuration from JSON file
-def load_config(config_file=None):
-    """
-    Load Apstra configuration from JSON file.
-    Args:
-        config_file: Optional path to config file. Defaults to 'apstra_config.json'
-    """
+def _resolve_config_path(config_file=None):
+    """Returns the absolute path of the config file, defaulting to apstra_config.json"""
     if config_file is None:
         config_file = 'apstra_config.json'
     
     # If not absolute path, look in same directory as this script
     if not os.path.isabs(config_file):
         config_file = os.path.join(os.path.dirname(__file__), config_file)
-    
+    return config_file
+
+# Parsed config files are cached per path, so repeated loads (re-imports,
+# per-test initialize_config calls) read the file from disk only once
+@functools.lru_cache(maxsize=8)
+def _read_config(config_file):
     try:
-        with open(config_file, 'r') as f:
-            return json.load(f)
+        # Binary read straight into _loads: orjson parses the bytes without a text decode pass
+        with open(config_file, 'rb') as f:
+            return _loads(f.read())
     except FileNotFoundError:
         logger.error(f"Config file not found: {config_file}")
         logger.error(f"Please create a config file based on apstra_config_sample.json")
         return {}
-    except json.JSONDecodeError:
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
         logger.error(f"Invalid JSON in config file: {config_file}")
         return {}
 
-def initialize_config(config_file=None):
-    """Initialize global configuration variables from specified config file"""
-    global server, port, username, password
-    config = load_config(config_file)
-    # Support both generic and legacy field names for backward compatibility
-    server = config.get('server') or config.get('aos_server', '')
-    port = config.get('port') or config.get('aos_port', '')
-    username = config.get('username', '')
-    password = config.get('password', '')
-
-# Load default configuration
-initialize_config()
-
-# Session-based credential storage for user sessions
-_user_sessions = {}
+def load_config(config_file=None):
+    """
+    Load Apstra configuration from JSON file.
+    The parsed file is cached; use reload_config() to pick up changes on disk.
+    Args:
+        config_file: Optional path to config file. Defaults to 'apstra_config.json'
+    """
+    return dict(_read_config(_resolve_config_path(config_file)))
+
+def initialize_config(config_file=None, force=False):
+    """Initialize global configuration variables from specified config file.
+    Pass force=True to re-read the file instead of using the cached copy."""
+    global CONFIG, server, port, username, password
+    if force:
+        _read_config.cache_clear()
+    previous = CONFIG
+    CONFIG = ApstraConfig.from_dict(load_config(config_file))
+    server, port, username, password = CONFIG.server, CONFIG.port, CONFIG.username, CONFIG.password
+    if previous is not None and (force or CONFIG != previous):
+        # Sessions hold tokens for the old credentials and the caches hold
+        # results from the old server; neither may outlive the config
+        close()
+        clear_caches()
+
+def reload_config(config_file=None):
+    """Re-read the config file from disk and re-initialize the global configuration"""
+    initialize_config(config_file, force=True)
+
+def _get_config():
+    """Returns the active configuration, loading the default config file on first use"""
+    if CONFIG is None:
+        initialize_config()
+    return CONFIG
+
+def _raise_for_error(response):
+    """
+    Raise httpx.HTTPStatusError for any non-2xx response, like raise_for_status(),
+    except 304 Not Modified answering a conditional request (If-None-Match),
+    which ETag revalidation passes through to the caller.
+    A single status check on the success path.
+    """
+    status = response.status_code
+    if 200 <= status < 300:
+        return
+    if status == 304 and 'If-None-Match' in response.request.headers:
+        return
+    response.raise_for_status()
+
+# Auth tokens are reused for AUTH_TOKEN_TTL seconds, kept below Apstra's
+# default session lifetime so cached tokens stay valid
+AUTH_TOKEN_TTL = 3000
+
+class ApstraClient:
+    """
+    Authenticated session against one Apstra server.
+    
+    Wraps pooled httpx clients whose base_url and AuthToken header are set once,
+    so API calls only pass the path. The login happens lazily on the first
+    request, is reused for AUTH_TOKEN_TTL seconds and is refreshed once when
+    the server rejects the token with HTTP 401. Connections are kept alive
+    (HTTP/2 when available) across calls.
+    
+    Usable as a context manager (``with`` or ``async with``) to close its
+    connection pools deterministically.
+    
+    Args:
+        server: Server as host:port
+        user: Username
+        passwd: Password
+    """
+    
+    # One instance per (server, user, password digest) is kept until evicted;
+    # slots keep them small. __weakref__ is needed by weakref.finalize.
+    __slots__ = ('server', 'user', '_passwd', '_token_expiry', '_lock', '_headers', '_client',
+                 '_aclient', '_alock', '_aclient_loop', '_finalizer', '__weakref__')
+    
+    def __init__(self, server, user, passwd):
+        self.server = server
+        self.user = user
+        self._passwd = passwd
+        self._token_expiry = 0.0
+        self._lock = threading.Lock()
+        self._headers = { 'Content-Type':"application/json", 'Cache-Control':"no-cache" }
+        self._client = httpx.Client(
+            base_url=f'https://{server}',
+            headers=self._headers,
+            transport=httpx.HTTPTransport(
+                verify=_SSL_CONTEXT, limits=_LIMITS, http2=_HTTP2, retries=_TRANSPORT_RETRIES,
+                socket_options=_SOCKET_OPTIONS),
+            timeout=30.0
+        )
+        # Async client and login lock bound to the event loop they were created
+        # on (pooled connections and asyncio locks cannot be reused across loops)
+        self._aclient = None
+        self._alock = None
+        self._aclient_loop = None
+        # Safety net for sessions that are never closed explicitly: releases
+        # the sync pool when the session is collected or at interpreter exit
+        self._finalizer = weakref.finalize(self, self._client.close)
+    
+    @property
+    def headers(self):
+        """Copy of the headers sent with every request, including AuthToken once logged in"""
+        return dict(self._headers)
+    
+    def _login_payload(self):
+        return {"username": self.user, "password": self._passwd}
+    
+    def _accept_login(self, response):
+        """Validates a login response and installs the token on the clients"""
+        if response.status_code != 201:
+            raise Exception(f'Authentication failed: HTTP {response.status_code} - {response.text}')
+        self._headers['AuthToken'] = response.json()['token']
+        self._token_expiry = time.monotonic() + AUTH_TOKEN_TTL
+        self._client.headers['AuthToken'] = self._headers['AuthToken']
+        if self._aclient is not None:
+            self._aclient.headers['AuthToken'] = self._headers['AuthToken']
+    
+    def _token_valid(self):
+        return 'AuthToken' in self._headers and time.monotonic() < self._token_expiry
+    
+    def invalidate(self):
+        """Forget the current token so the next request logs in again"""
+        self._token_expiry = 0.0
+    
+    def _login(self):
+        response = self._client.post(_PATH_LOGIN, json=self._login_payload())
+        self._accept_login(response)
+    
+    def _superseded(self, stale_token):
+        """True when another caller already replaced stale_token with a valid token"""
+        return (stale_token is not None and self._token_valid()
+                and self._headers.get('AuthToken') != stale_token)
+    
+    # Logins are single-flight: concurrent callers that find the token missing,
+    # expired or rejected wait on the lock, and all but the first reuse the
+    # token it obtained instead of hitting the login endpoint again.
+    def refresh_auth(self, stale_token=None):
+        """
+        Log in and update the AuthToken header.
+        
+        Args:
+            stale_token: Token that was rejected; the login is skipped when it
+                has already been replaced by another caller
+        """
+        with self._lock:
+            if self._superseded(stale_token):
+                return
+            self._login()
+    
+    def ensure_auth(self):
+        """Log in unless a valid token is already held"""
+        if self._token_valid():
+            return
+        with self._lock:
+            if not self._token_valid():
+                self._login()
+    
+    def _send(self, method, path, **kwargs):
+        """Send one request, retrying transient failures for idempotent methods"""
+        attempts = _RETRY_ATTEMPTS if method.upper() in _RETRY_METHODS else 1
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            try:
+                response = self._client.request(method, path, **kwargs)
+            except _RETRY_EXCEPTIONS as e:
+                if last:
+                    raise
+                reason = repr(e)
+            else:
+                if last or response.status_code not in _RETRY_STATUS_CODES:
+                    return response
+                reason = f"HTTP {response.status_code}"
+            wait = _retry_wait(attempt)
+            logger.warning(f"{method} {path} failed ({reason}), retrying in {wait:.2f}s")
+            time.sleep(wait)
+    
+    def request(self, method, path, **kwargs):
+        """
+        Send an authenticated request, re-authenticating once on HTTP 401.
+        Read timeouts, dropped connections and 502/503/504 responses are
+        retried with backoff for idempotent methods.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE)
+            path: API path starting with /api/
+            **kwargs: Extra arguments passed to httpx (json, params, ...)
+        
+        Returns:
+            httpx.Response with a successful status code
+        """
+        kwargs = _encode_body(kwargs)
+        self.ensure_auth()
+        token = self._headers.get('AuthToken')
+        response = self._send(method, path, **kwargs)
+        if response.status_code == 401:
+            logger.info(f"Token rejected for {self.server}, re-authenticating")
+            self.refresh_auth(stale_token=token)
+            response = self._send(method, path, **kwargs)
+        _raise_for_error(response)
+        return response
+    
+    @contextlib.contextmanager
+    def stream(self, method, path, **kwargs):
+        """
+        Context manager yielding an authenticated response whose body has not
+        been read yet, re-authenticating once on HTTP 401.
+        """
+        self.ensure_auth()
+        token = self._headers.get('AuthToken')
+        with self._client.stream(method, path, **kwargs) as response:
+            if response.status_code != 401:
+                _raise_for_error(response)
+                yield response
+                return
+        logger.info(f"Token rejected for {self.server}, re-authenticating")
+        self.refresh_auth(stale_token=token)
+        with self._client.stream(method, path, **kwargs) as response:
+            _raise_for_error(response)
+            yield response
+    
+    def _get_aclient(self):
+        """Returns the async client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = httpx.AsyncClient(
+                base_url=f'https://{self.server}',
+                headers=self._headers,
+                transport=httpx.AsyncHTTPTransport(
+                    verify=_SSL_CONTEXT, limits=_LIMITS, http2=_HTTP2, retries=_TRANSPORT_RETRIES,
+                    socket_options=_SOCKET_OPTIONS),
+                timeout=30.0
+            )
+            self._alock = asyncio.Lock()
+            self._aclient_loop = loop
+        return self._aclient
+    
+    async def _alogin(self, client):
+        response = await client.post(_PATH_LOGIN, json=self._login_payload())
+        self._accept_login(response)
+    
+    async def arefresh_auth(self, stale_token=None):
+        """Async counterpart of refresh_auth()"""
+        client = self._get_aclient()
+        async with self._alock:
+            if self._superseded(stale_token):
+                return
+            await self._alogin(client)
+    
+    async def aensure_auth(self):
+        """Async counterpart of ensure_auth()"""
+        if self._token_valid():
+            return
+        client = self._get_aclient()
+        async with self._alock:
+            if not self._token_valid():
+                await self._alogin(client)
+    
+    async def _asend(self, method, path, **kwargs):
+        """Async counterpart of _send()"""
+        attempts = _RETRY_ATTEMPTS if method.upper() in _RETRY_METHODS else 1
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            try:
+                response = await self._get_aclient().request(method, path, **kwargs)
+            except _RETRY_EXCEPTIONS as e:
+                if last:
+                    raise
+                reason = repr(e)
+            else:
+                if last or response.status_code not in _RETRY_STATUS_CODES:
+                    return response
+                reason = f"HTTP {response.status_code}"
+            wait = _retry_wait(attempt)
+            logger.warning(f"{method} {path} failed ({reason}), retrying in {wait:.2f}s")
+            await asyncio.sleep(wait)
+    
+    async def arequest(self, method, path, **kwargs):
+        """Async counterpart of request(), with the same one-shot re-auth on 401"""
+        kwargs = _encode_body(kwargs)
+        await self.aensure_auth()
+        token = self._headers.get('AuthToken')
+        response = await self._asend(method, path, **kwargs)
+        if response.status_code == 401:
+            logger.info(f"Token rejected for {self.server}, re-authenticating")
+            await self.arefresh_auth(stale_token=token)
+            response = await self._asend(method, path, **kwargs)
+        _raise_for_error(response)
+        return response
+    
+    async def aclose(self):
+        """Close the async client if it belongs to the running event loop"""
+        if self._aclient is not None and self._aclient_loop is asyncio.get_running_loop():
+            await self._aclient.aclose()
+            self._aclient = None
+            self._alock = None
+            self._aclient_loop = None
+    
+    def _close_aclient(self):
+        """
+        Close the async client from sync code, on whichever loop it belongs to.
+        
+        The close is awaited when that loop is idle, scheduled on it when it is
+        running, and skipped when it has already been closed (its transports
+        went away with it).
+        """
+        client, loop = self._aclient, self._aclient_loop
+        if client is None:
+            return
+        self._aclient = None
+        self._alock = None
+        self._aclient_loop = None
+        if loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        try:
+            if loop is running:
+                task = loop.create_task(client.aclose())
+                _closing_tasks.add(task)
+                task.add_done_callback(_closing_tasks.discard)
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            else:
+                loop.run_until_complete(client.aclose())
+        except RuntimeError as e:
+            logger.debug(f"Could not close async client for {self.server}: {e}")
+    
+    def close(self):
+        """Close the sync and async clients and release their pooled connections"""
+        self._finalizer()
+        self._close_aclient()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+        self.close()
+
+# Async client closes scheduled on a running loop, referenced until they finish
+_closing_tasks = set()
+
+# Session-based credential storage for user sessions:
+# (server, user, password digest) -> ApstraClient,
+# kept in least-recently-used order and bounded by APSTRA_MAX_SESSIONS. An evicted
+# session is closed, releasing both its sync and async connection pools.
+MAX_SESSIONS = int(os.environ.get('APSTRA_MAX_SESSIONS', '128'))
+_user_sessions = collections.OrderedDict()
+_sessions_lock = threading.Lock()
+
+def _resolve_server(server_url=None):
+    """Returns the host:port to use, from the override or the global config"""
+    return server_url or _get_config().host
+
+def _get_session(server_url=None, user=None, passwd=None):
+    """Returns the ApstraClient for the server/user, creating it on first use"""
+    auth_user = user or _get_config().username
+    auth_pass = passwd or _get_config().password
+    # The password digest is part of the key, so a call with different (or
+    # wrong) credentials never reuses a token obtained with the right ones
+    key = (_resolve_server(server_url), auth_user, hashlib.sha256((auth_pass or "").encode()).hexdigest())
+    evicted = None
+    with _sessions_lock:
+        session = _user_sessions.get(key)
+        if session is None:
+            session = ApstraClient(key[0], auth_user, auth_pass)
+            _user_sessions[key] = session
+            if len(_user_sessions) > MAX_SESSIONS:
+                evicted_key, evicted = _user_sessions.popitem(last=False)
+                logger.debug(f"Evicted session for {evicted_key[1]}@{evicted_key[0]}")
+        else:
+            _user_sessions.move_to_end(key)
+    # Closed outside the lock: closing the async client may wait on its loop
+    if evicted is not None:
+        evicted.close()
+    return session
+
+def close():
+    """Close all sessions and release pooled connections"""
+    with _sessions_lock:
+        sessions = list(_user_sessions.values())
+        _user_sessions.clear()
+    for session in sessions:
+        session.close()
+
+atexit.register(close)
+
+def warmup(server_url=None):
+    """
+    Log in to the server in a background thread, so the TLS handshake and the
+    login round-trip are paid before the first tool call instead of during it.
+    Failures are only logged; the first real request will retry the login.
+    
+    Returns:
+        The started daemon thread
+    """
+    def run():
+        try:
+            _get_session(server_url).ensure_auth()
+            logger.info(f"Warmed up connection to {_resolve_server(server_url)}")
+        except Exception as e:
+            logger.warning(f"Connection warmup failed: {e}")
+    thread = threading.Thread(target=run, name="apstra-warmup", daemon=True)
+    thread.start()
+    return thread
+
+async def aclose():
+    """Close the async clients of all sessions for the running event loop"""
+    for session in list(_user_sessions.values()):
+        await session.aclose()
 
 # The authentication function using global config
 def auth(server_url=None, user=None, passwd=None):
     """
     Authenticate with Apstra server using either provided credentials or global config.
+    The session's token is reused until it expires, so only the first call
+    (or the first call after expiry/invalidation) performs a login.
     
     Args:
         server_url: Optional server URL override
-        user: Optional username override  
+        user: Optional username override
         passwd: Optional password override
     
     Returns:
         Tuple of (headers, server) for API requests
     """
-    # Use provided parameters or fall back to global config
-    auth_user = user or username
-    auth_pass = passwd or password
-    server_override = None
-    port_override = None
-    
-    # Handle server URL construction
-    if server_url:
-        server = server_url
-    elif server_override:
-        # Use server from user credentials
-        if port_override:
-            server = f"{server_override}:{port_override}"
-        elif ':' in server_override:
-            server = server_override
-        else:
-            server = f"{server_override}:443"
-    else:
-        # Use global config (fallback for backward compatibility)
-        global_server = globals().get('server', '')
-        global_port = globals().get('port', '')
-        if ':' in global_server:
-            server = global_server
-        else:
-            if global_port:
-                server = f"{global_server}:{global_port}"
-            else:
-                server = f"{global_server}:443"
+    session = _get_session(server_url, user, passwd)
     try:
-        url_login = f'https://{server}/api/user/login'
-        headers_init = { 'Content-Type':"application/json", 'Cache-Control':"no-cache" }
-        data = f'{{"username": "{auth_user}","password":"{auth_pass}"}}'
-        response = httpx.post(url_login, data=data, headers=headers_init, verify=False)
-        if response.status_code != 201:
-            raise Exception(f'Authentication failed: HTTP {response.status_code} - {response.text}')
-        auth_token = response.json()['token']
-        headers = { 'AuthToken':auth_token, 'Content-Type':"application/json", 'Cache-Control':"no-cache" }
-        return(headers, server)
+        session.ensure_auth()
+        return(session.headers, session.server)
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}")
         raise  # Re-raise the exception instead of returning None
 
+def auth_status(server_url=None):
+    """
+    Connection check for health probes. Returns "OK" while the session holds a
+    valid token, so repeated probes do not log in again; only an expired or
+    missing token triggers a login. Raises if that login fails.
+    """
+    _get_session(server_url).ensure_auth()
+    return "OK"
+
+def invalidate_auth(server_url=None, user=None):
+    """Drop the cached tokens for a server/user so the next auth() logs in again"""
+    server = _resolve_server(server_url)
+    auth_user = user or _get_config().username
+    # Sessions are keyed by password digest too; invalidate every one held for
+    # this server/user without creating a new session
+    with _sessions_lock:
+        sessions = [session for key, session in _user_sessions.items()
+                    if key[0] == server and key[1] == auth_user]
+    for session in sessions:
+        session.invalidate()
+
+def _request(method, path, server_url=None, **kwargs):
+    """
+    Send an authenticated request to the Apstra API through the server's session.
+    
+    Args:
+        method: HTTP method (GET, POST, PUT, PATCH, DELETE)
+        path: API path starting with /api/
+        server_url: Optional server URL override
+        **kwargs: Extra arguments passed to httpx (json, params, ...)
+    
+    Returns:
+        httpx.Response with a successful status code
+    """
+    return _get_session(server_url).request(method, path, **kwargs)
+
+# Response cache for read-mostly catalog queries: (function, args) -> (result, expiry)
+_ERROR_PREFIX = "An unexpected error occurred"
+_resp_cache = {}
+_resp_cache_lock = threading.Lock()
+
+def ttl_cache(seconds=60, name=None):
+    """
+    Decorator caching a getter's JSON result for the given number of seconds,
+    keyed by function name, configured server and arguments. Error results are
+    never cached. Works on sync and async getters; pass the sync getter's name
+    as name= so an async variant shares its entries and invalidate_cache() call.
+    """
+    def decorator(func):
+        cache_name = name or func.__name__
+        
+        def lookup(args, kwargs):
+            # The resolved default server is part of the key, so results for
+            # one configured server are never served for another
+            key = (cache_name, _resolve_server(), args, tuple(sorted(kwargs.items())))
+            with _resp_cache_lock:
+                cached = _resp_cache.get(key)
+            if cached and time.monotonic() < cached[1]:
+                return key, cached[0]
+            return key, None
+        
+        def store(key, result):
+            if not result.startswith(_ERROR_PREFIX):
+                with _resp_cache_lock:
+                    _resp_cache[key] = (result, time.monotonic() + seconds)
+            return result
+        
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key, cached = lookup(args, kwargs)
+                if cached is not None:
+                    return cached
+                return store(key, await func(*args, **kwargs))
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key, cached = lookup(args, kwargs)
+            if cached is not None:
+                return cached
+            return store(key, func(*args, **kwargs))
+        return wrapper
+    return decorator
+
+def invalidate_cache(func_name):
+    """Drop all cached results of the named getter (e.g. 'get_bp') after a write"""
+    with _resp_cache_lock:
+        for key in [key for key in _resp_cache if key[0] == func_name]:
+            del _resp_cache[key]
+
+# Conditional GET cache: (server, path, unwrap) -> (etag, result, expiry).
+# GET results carrying an ETag are revalidated with If-None-Match, so an
+# unchanged resource costs a bodyless 304 instead of a full transfer and
+# re-serialization. LRU-bounded, and entries expire to bound memory use.
+_ETAG_CACHE_SIZE = 128
+_ETAG_CACHE_TTL = 60
+_etag_cache = collections.OrderedDict()
+_etag_cache_lock = threading.Lock()
+
+def _etag_lookup(key):
+    """Returns the live (etag, result, expiry) entry for key, or None"""
+    with _etag_cache_lock:
+        entry = _etag_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[2]:
+            del _etag_cache[key]
+            return None
+        _etag_cache.move_to_end(key)
+        return entry
+
+def _etag_store(key, etag, result):
+    with _etag_cache_lock:
+        _etag_cache[key] = (etag, result, time.monotonic() + _ETAG_CACHE_TTL)
+        _etag_cache.move_to_end(key)
+        while len(_etag_cache) > _ETAG_CACHE_SIZE:
+            _etag_cache.popitem(last=False)
+
+def _conditional(method, path, server_url, unwrap):
+    """Returns (cache key, cached entry, request kwargs) for a possibly conditional request"""
+    if method != 'GET':
+        return None, None, {}
+    key = (_resolve_server(server_url), path, unwrap)
+    cached = _etag_lookup(key)
+    if cached is None:
+        return key, None, {}
+    return key, cached, {'headers': {'If-None-Match': cached[0]}}
+
+def _fetch_result(response, key, cached, unwrap):
+    """Turns a getter response into its result string, using/refreshing the ETag cache"""
+    if cached is not None and response.status_code == 304:
+        return cached[1]
+    if unwrap:
+        result = _dumps(_loads(response.content)[unwrap])
+    else:
+        result = response.text
+    etag = response.headers.get('ETag')
+    if key is not None and etag:
+        _etag_store(key, etag, result)
+    return result
+
+# Error contract shared by the API functions
+def _error_message(e):
+    """Formats an exception as the "An unexpected error occurred: ..." string and logs it"""
+    error_msg = f"{_ERROR_PREFIX}: {e}"
+    logger.error(error_msg)
+    return error_msg
+
+def _error_string(func):
+    """
+    Catch any exception raised by an API function (sync or async), log it and
+    return it as an "An unexpected error occurred: ..." string, the error
+    contract of the tools.
+    """
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                return _error_message(e)
+        return async_wrapper
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            return _error_message(e)
+    return wrapper
+
+# Shared body of the read-only getters
+def _fetch_raw(method, path, server_url=None, unwrap=None):
+    """
+    Send a request and return the response body, raising on failure.
+    GET results are revalidated through the ETag cache. Internal callers use
+    this directly so failures propagate without being formatted into a string.
+    
+    Args:
+        method: HTTP method
+        path: API path starting with /api/
+        server_url: Optional server URL override
+        unwrap: Optional top-level key whose value is returned instead of the whole body
+    """
+    key, cached, kwargs = _conditional(method, path, server_url, unwrap)
+    response = _request(method, path, server_url, **kwargs)
+    return _fetch_result(response, key, cached, unwrap)
+
+# Public getters return an error string on failure instead of raising
+_fetch = _error_string(_fetch_raw)
 
 # Get blueprints
+@ttl_cache(seconds=60)
 def get_bp(server_url=None):
     """Gets blueprint information"""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints'
-        response = httpx.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return json.dumps(response.json()['items'], indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    return _fetch('GET', _PATH_BLUEPRINTS, server_url, unwrap='items')
 
 # Get racks
 def get_racks(blueprint_id, server_url=None):
     """Gets rack information for a blueprint"""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}/racks'
-        response = httpx.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return json.dumps(response.json()['items'], indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    return _fetch('GET', _PATH_RACKS.format(blueprint_id), server_url, unwrap='items')
 
 # Get routing zones
 def get_rz(blueprint_id, server_url=None):
     """Gets routing zone information for a blueprint"""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}/security-zones'
-        response = httpx.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    return _fetch('GET', _PATH_RZ.format(blueprint_id), server_url)
 
 # Get virtual networks
 def get_vn(blueprint_id, server_url=None):
     """Gets virtual networks information for a blueprint. 
     Also has information of the systems to which this virtual network is bound and on which VLAN ID"""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}/virtual-networks'
-        response = httpx.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    return _fetch('GET', _PATH_VN.format(blueprint_id), server_url)
 
 # Get connectivity templates
 def get_ct(blueprint_id, server_url=None):
     """Gets the connectivity templates or endpoint policies for a blueprint.
     Also has information of the virtual network associated with this connectivity template
     Those policy IDs that are makred as "visible": true, will be used to assign interfaces to connectivity templates"""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}/obj-policy-export'
-        response = httpx.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    return _fetch('GET', _PATH_CT.format(blueprint_id), server_url)
 
 # Get application endpoints
 def get_app_ep(blueprint_id, server_url=None):
     """Returns all possible application endpoints for connectivity templates in a blueprint."""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}/obj-policy-application-points'
-        response = httpx.post(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    return _fetch('POST', _PATH_APP_EP.format(blueprint_id), server_url)
 
 # Get system info
 def get_system_info(blueprint_id, server_url=None):
     """Gets information about systems inside the blueprint"""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}/experience/web/system-info'
-        response = httpx.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    return _fetch('GET', _PATH_SYSTEM_INFO.format(blueprint_id), server_url)
 
 # Check staging version through diff-status
 def get_diff_status(blueprint_id, server_url=None):
     """Gets the diff status for a blueprint"""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}/diff-status'
-        response = httpx.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    return _fetch('GET', _PATH_DIFF_STATUS.format(blueprint_id), server_url)
 
 # Deploy config
+@_error_string
 def deploy(blueprint_id, description, staging_version, server_url=None):
     """Deploys the config for a blueprint"""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}/deploy'
-        data = f'{{"version": {staging_version},"description":"{description}"}}'
-        response = httpx.put(url, headers=headers, data=data, verify=False)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    payload = {"version": staging_version, "description": description}
+    response = _request('PUT', _PATH_DEPLOY.format(blueprint_id), server_url, json=payload)
+    invalidate_systems(blueprint_id, server_url)
+    return response.text
 
 # Get templates
+@ttl_cache(seconds=60)
 def get_templates(server_url=None):
     """Gets available templates for blueprint creation"""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/design/templates'
-        response = httpx.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    return _fetch('GET', _PATH_TEMPLATES, server_url)
 
 
 # Delete blueprint
+@_error_string
 def delete_blueprint(blueprint_id, server_url=None):
     """Deletes a blueprint by ID"""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}'
-        response = httpx.delete(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return response.text if response.text else "Blueprint deleted successfully"
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    response = _request('DELETE', _PATH_BLUEPRINT.format(blueprint_id), server_url)
+    invalidate_cache('get_bp')
+    invalidate_systems(blueprint_id, server_url)
+    return response.text if response.text else "Blueprint deleted successfully"
 
 # Get anomalies
 def get_anomalies(blueprint_id, server_url=None):
     """Gets anomalies information for a blueprint"""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}/anomalies'
-        response = httpx.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    return _fetch('GET', _PATH_ANOMALIES.format(blueprint_id), server_url)
 
 # Get remote gateways
 def get_remote_gw(blueprint_id, server_url=None):
     """Gets a list of all remote gateways within a blueprint, keyed by remote gateway node ID."""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}/remote_gateways'
-        response = httpx.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    return _fetch('GET', _PATH_REMOTE_GW.format(blueprint_id), server_url)
 
 # Get protocol sessions
 def get_protocol_sessions(blueprint_id, server_url=None):
     """Return a list of all protocol sessions from the specified blueprint."""
+    return _fetch('GET', _PATH_PROTOCOL_SESSIONS.format(blueprint_id), server_url)
+
+# STREAMING VARIANTS - generators for very large responses
+#
+# Anomalies, protocol sessions and system info can be tens of MB on large
+# fabrics. These generators yield one item at a time, feeding the raw byte
+# stream to ijson so memory stays flat regardless of response size. Unlike
+# the getters above they raise on errors instead of returning an error string.
+
+def _iter_items(path, key, server_url=None):
+    """Yield the elements of the top-level list at key in the response of GET path"""
+    with _get_session(server_url).stream('GET', path) as response:
+        if ijson is None:
+            yield from _loads(response.read())[key]
+            return
+        items = ijson.sendable_list()
+        parser = ijson.items_coro(items, f'{key}.item')
+        for chunk in response.iter_bytes():
+            parser.send(chunk)
+            yield from items
+            del items[:]
+        parser.close()
+        yield from items
+
+def iter_anomalies(blueprint_id, server_url=None):
+    """Yield the anomalies of a blueprint one at a time"""
+    return _iter_items(_PATH_ANOMALIES.format(blueprint_id), 'items', server_url)
+
+def iter_protocol_sessions(blueprint_id, server_url=None):
+    """Yield the protocol sessions of a blueprint one at a time"""
+    return _iter_items(_PATH_PROTOCOL_SESSIONS.format(blueprint_id), 'items', server_url)
+
+def iter_system_info(blueprint_id, server_url=None):
+    """Yield the systems of a blueprint one at a time"""
+    return _iter_items(_PATH_SYSTEM_INFO.format(blueprint_id), 'data', server_url)
+
+# ASYNC VARIANTS - awaitable getters for concurrent fan-out
+#
+# These mirror the sync getters above but run on an httpx.AsyncClient so that
+# independent queries can be issued concurrently, e.g.:
+#
+#     racks, rz, vn, systems = await asyncio.gather(
+#         get_racks_async(bp), get_rz_async(bp),
+#         get_vn_async(bp), get_system_info_async(bp))
+#
+# Sessions and auth tokens are shared with the sync path.
+
+async def auth_async(server_url=None, user=None, passwd=None):
+    """
+    Async counterpart of auth(). Shares the same sessions and tokens.
+
+    Returns:
+        Tuple of (headers, server) for API requests
+    """
+    session = _get_session(server_url, user, passwd)
     try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}/protocol-sessions'
-        response = httpx.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
+        await session.aensure_auth()
+        return(session.headers, session.server)
     except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+        logger.error(f"An unexpected error occurred: {e}")
+        raise
+
+# Concurrency gate for async requests. Apstra latency degrades once more than
+# ~2-4 requests per server are in flight, so fan-out (gather across blueprints
+# or bundle parts) is capped here. Override with APSTRA_MAX_CONCURRENCY or
+# set_max_concurrency(). asyncio primitives bind to one event loop, so the
+# semaphore is recreated when the running loop changes.
+_max_concurrency = int(os.environ.get('APSTRA_MAX_CONCURRENCY', '4'))
+_sem = None
+_sem_loop = None
+
+def set_max_concurrency(n):
+    """
+    Set how many async API requests may be in flight at once.
+    
+    Args:
+        n: Maximum number of concurrent requests (2-4 per server works best)
+    """
+    global _max_concurrency, _sem, _sem_loop
+    if n < 1:
+        raise ValueError("max concurrency must be at least 1")
+    _max_concurrency = n
+    _sem = None
+    _sem_loop = None
+
+def _get_semaphore():
+    """Returns the concurrency gate for the running event loop"""
+    global _sem, _sem_loop
+    loop = asyncio.get_running_loop()
+    if _sem is None or _sem_loop is not loop:
+        _sem = asyncio.Semaphore(_max_concurrency)
+        _sem_loop = loop
+    return _sem
+
+async def _request_async(method, path, server_url=None, **kwargs):
+    """Async counterpart of _request(), gated by the module concurrency limit"""
+    async with _get_semaphore():
+        return await _get_session(server_url).arequest(method, path, **kwargs)
+
+@_error_string
+async def _fetch_async(method, path, server_url=None, unwrap=None):
+    """Async counterpart of _fetch()"""
+    key, cached, kwargs = _conditional(method, path, server_url, unwrap)
+    response = await _request_async(method, path, server_url, **kwargs)
+    return _fetch_result(response, key, cached, unwrap)
+
+@ttl_cache(seconds=60, name='get_bp')
+async def get_bp_async(server_url=None):
+    """Gets blueprint information (async)"""
+    return await _fetch_async('GET', _PATH_BLUEPRINTS, server_url, unwrap='items')
+
+async def get_racks_async(blueprint_id, server_url=None):
+    """Gets rack information for a blueprint (async)"""
+    return await _fetch_async('GET', _PATH_RACKS.format(blueprint_id), server_url, unwrap='items')
+
+async def get_rz_async(blueprint_id, server_url=None):
+    """Gets routing zone information for a blueprint (async)"""
+    return await _fetch_async('GET', _PATH_RZ.format(blueprint_id), server_url)
+
+async def get_vn_async(blueprint_id, server_url=None):
+    """Gets virtual networks information for a blueprint (async)"""
+    return await _fetch_async('GET', _PATH_VN.format(blueprint_id), server_url)
+
+async def get_ct_async(blueprint_id, server_url=None):
+    """Gets the connectivity templates or endpoint policies for a blueprint (async)"""
+    return await _fetch_async('GET', _PATH_CT.format(blueprint_id), server_url)
+
+async def get_system_info_async(blueprint_id, server_url=None):
+    """Gets information about systems inside the blueprint (async)"""
+    return await _fetch_async('GET', _PATH_SYSTEM_INFO.format(blueprint_id), server_url)
+
+async def get_diff_status_async(blueprint_id, server_url=None):
+    """Gets the diff status for a blueprint (async)"""
+    return await _fetch_async('GET', _PATH_DIFF_STATUS.format(blueprint_id), server_url)
+
+@ttl_cache(seconds=60, name='get_templates')
+async def get_templates_async(server_url=None):
+    """Gets available templates for blueprint creation (async)"""
+    return await _fetch_async('GET', _PATH_TEMPLATES, server_url)
+
+async def get_anomalies_async(blueprint_id, server_url=None):
+    """Gets anomalies information for a blueprint (async)"""
+    return await _fetch_async('GET', _PATH_ANOMALIES.format(blueprint_id), server_url)
+
+async def get_remote_gw_async(blueprint_id, server_url=None):
+    """Gets a list of all remote gateways within a blueprint (async)"""
+    return await _fetch_async('GET', _PATH_REMOTE_GW.format(blueprint_id), server_url)
+
+async def get_protocol_sessions_async(blueprint_id, server_url=None):
+    """Return a list of all protocol sessions from the specified blueprint (async)"""
+    return await _fetch_async('GET', _PATH_PROTOCOL_SESSIONS.format(blueprint_id), server_url)
+
+# Per-blueprint endpoints fetched together by get_blueprint_bundle(): name -> (path, key to unwrap)
+_BUNDLE_PATHS = {
+    'racks': (_PATH_RACKS, 'items'),
+    'rz': (_PATH_RZ, None),
+    'vn': (_PATH_VN, None),
+    'systems': (_PATH_SYSTEM_INFO, None),
+    'anomalies': (_PATH_ANOMALIES, None),
+}
+
+# Endpoints checked together by verify_deployment() after a deploy: name -> (path, key to unwrap)
+_VERIFY_PATHS = {
+    'diff_status': (_PATH_DIFF_STATUS, None),
+    'anomalies': (_PATH_ANOMALIES, None),
+    'protocol_sessions': (_PATH_PROTOCOL_SESSIONS, None),
+}
+
+async def _gather_parts_async(blueprint_id, parts, server_url=None):
+    """
+    Fetch several per-blueprint endpoints concurrently behind a single login.
+    
+    Args:
+        blueprint_id: Blueprint ID
+        parts: Dict of name -> (path template, key to unwrap or None)
+        server_url: Optional server URL override
+    
+    Returns:
+        Dict keyed by part name. A part that failed holds its error message instead of data.
+    """
+    # Authenticate once up front so the concurrent requests share the cached token
+    await auth_async(server_url)
+    
+    async def fetch(path, key):
+        response = await _request_async('GET', path.format(blueprint_id), server_url)
+        logger.debug(f"Fetched {path.format(blueprint_id)} over {response.http_version}")
+        data = _loads(response.content)
+        return data[key] if key else data
+    
+    names = list(parts)
+    results = await asyncio.gather(*(fetch(*parts[name]) for name in names),
+                                   return_exceptions=True)
+    combined = {}
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to fetch {name} for blueprint {blueprint_id}: {result}")
+            combined[name] = f"{_ERROR_PREFIX}: {result}"
+        else:
+            combined[name] = result
+    return combined
+
+@_error_string
+async def get_blueprint_bundle_async(blueprint_id, server_url=None):
+    """
+    Fetch racks, routing zones, virtual networks, systems and anomalies of a
+    blueprint concurrently behind a single login. Requests in flight are capped
+    by the module concurrency gate (see set_max_concurrency).
+    
+    Args:
+        blueprint_id: Blueprint ID
+        server_url: Optional server URL override
+    
+    Returns:
+        JSON string keyed by racks, rz, vn, systems and anomalies. A part that
+        failed holds its error message instead of data.
+    """
+    return _dumps(await _gather_parts_async(blueprint_id, _BUNDLE_PATHS, server_url))
+
+@_error_string
+async def verify_deployment_async(blueprint_id, server_url=None):
+    """
+    Fetch the post-deploy verification data of a blueprint (diff status,
+    anomalies and protocol sessions) concurrently behind a single login.
+    
+    Args:
+        blueprint_id: Blueprint ID
+        server_url: Optional server URL override
+    
+    Returns:
+        JSON string keyed by diff_status, anomalies and protocol_sessions. A part
+        that failed holds its error message instead of data.
+    """
+    return _dumps(await _gather_parts_async(blueprint_id, _VERIFY_PATHS, server_url))
+
+def _run_sync(coro):
+    """Run a coroutine to completion from sync code, closing its async client afterwards"""
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await aclose()
+    return asyncio.run(runner())
 
-# # Get system info
+def get_blueprint_bundle(blueprint_id, server_url=None):
+    """Sync wrapper for get_blueprint_bundle_async(); must not be called from a running event loop"""
+    return _run_sync(get_blueprint_bundle_async(blueprint_id, server_url))
+
+def verify_deployment(blueprint_id, server_url=None):
+    """Sync wrapper for verify_deployment_async(); must not be called from a running event loop"""
+    return _run_sync(verify_deployment_async(blueprint_id, server_url))
 
 # CREATE FUNCTIONS - All create operations grouped together
 
+# Helper function to expand redundancy groups using already fetched system info
+def expand_leafs_from_systems(systems, system_ids):
+    """
+    Expand system IDs to individual leaf IDs using the system-info 'data' list.
+    
+    Args:
+        systems: List of systems as returned in system-info 'data'
+        system_ids: List of system IDs (may include redundancy groups)
+        
+    Returns:
+        List of individual leaf system IDs
+    """
+    redundancy_groups = set()
+    group_members = {}
+    for system in systems:
+        if system['role'] == 'redundancy_group':
+            redundancy_groups.add(system['id'])
+        elif system['role'] == 'leaf' and system.get('redundancy_group_id'):
+            group_members.setdefault(system['redundancy_group_id'], []).append(system['id'])
+    
+    individual_leafs = []
+    for system_id in system_ids:
+        if system_id in redundancy_groups:
+            # Find all individual leafs that belong to this redundancy group
+            individual_leafs.extend(group_members.get(system_id, []))
+        else:
+            # Single leaf or already individual leaf
+            individual_leafs.append(system_id)
+    return individual_leafs
+
+# Parsed system-info 'data' lists used for leaf expansion:
+# (server, blueprint_id) -> (systems, expiry). Topology rarely changes within
+# a session, so repeated create_vn calls skip the round-trip and the parse.
+SYSTEMS_CACHE_TTL = 30
+_systems_cache = {}
+_systems_cache_lock = threading.Lock()
+
+def _cached_systems(blueprint_id, server_url=None):
+    """Returns the cached system list for the blueprint, or None if absent/expired"""
+    key = (_resolve_server(server_url), blueprint_id)
+    with _systems_cache_lock:
+        entry = _systems_cache.get(key)
+    if entry and time.monotonic() < entry[1]:
+        return entry[0]
+    return None
+
+def _store_systems(blueprint_id, systems, server_url=None):
+    key = (_resolve_server(server_url), blueprint_id)
+    with _systems_cache_lock:
+        _systems_cache[key] = (systems, time.monotonic() + SYSTEMS_CACHE_TTL)
+
+def invalidate_systems(blueprint_id, server_url=None):
+    """Drop the cached system list of a blueprint"""
+    with _systems_cache_lock:
+        _systems_cache.pop((_resolve_server(server_url), blueprint_id), None)
+
+def _get_systems(blueprint_id, server_url=None):
+    """Returns the blueprint's system list, fetching it unless cached; raises on failure"""
+    systems = _cached_systems(blueprint_id, server_url)
+    if systems is None:
+        systems = _loads(_fetch_raw('GET', _PATH_SYSTEM_INFO.format(blueprint_id), server_url))['data']
+        _store_systems(blueprint_id, systems, server_url)
+    return systems
+
+def clear_caches():
+    """Drop all cached API results (ttl_cache, ETag and system-info caches)"""
+    with _resp_cache_lock:
+        _resp_cache.clear()
+    with _etag_cache_lock:
+        _etag_cache.clear()
+    with _systems_cache_lock:
+        _systems_cache.clear()
+
 # Helper function to get individual leaf IDs from redundancy groups
 def get_individual_leafs_from_system_ids(blueprint_id, system_ids, server_url=None):
     """
@@ -657,30 +1599,7 @@ def get_individual_leafs_from_system_ids(blueprint_id, system_ids, server_url=No
     """
     try:
         # Get system information to build the mapping
-        system_info_json = get_system_info(blueprint_id, server_url)
-        system_info = json.loads(system_info_json)
-        
-        individual_leafs = []
-        
-        for system_id in system_ids:
-            # Check if this system_id is a redundancy group
-            is_redundancy_group = False
-            
-            for system in system_info['data']:
-                if system['id'] == system_id and system['role'] == 'redundancy_group':
-                    is_redundancy_group = True
-                    break
-            
-            if is_redundancy_group:
-                # Find all individual leafs that belong to this redundancy group
-                for system in system_info['data']:
-                    if (system['role'] == 'leaf' and 
-                        system.get('redundancy_group_id') == system_id):
-                        individual_leafs.append(system['id'])
-            else:
-                # Single leaf or already individual leaf
-                individual_leafs.append(system_id)
-        
+        individual_leafs = expand_leafs_from_systems(_get_systems(blueprint_id, server_url), system_ids)
         logger.info(f"Expanded system_ids {system_ids} to individual leafs: {individual_leafs}")
         return individual_leafs
         
@@ -692,18 +1611,22 @@ def get_individual_leafs_from_system_ids(blueprint_id, system_ids, server_url=No
 # Normalization helper functions for layered architecture
 def normalize_to_string_list(value):
     """Convert various inputs to list of strings"""
+    # Fast path: already a list (the canonical form from Python callers)
+    if type(value) is list:
+        return value
     if value is None or value == "":
         return None
     
     if isinstance(value, str):
+        stripped = value.strip()
         # Handle JSON array: '["sys1", "sys2"]'
-        if value.strip().startswith('[') and value.strip().endswith(']'):
+        if stripped[:1] == '[' and stripped[-1:] == ']':
             try:
-                return json.loads(value)
+                return _loads(stripped)
             except json.JSONDecodeError:
                 raise ValueError(f"Invalid JSON array: {value}")
         # Handle single value: "sys1"
-        return [value.strip()]
+        return [stripped]
     
     if isinstance(value, list):
         return value
@@ -712,20 +1635,24 @@ def normalize_to_string_list(value):
 
 def normalize_to_int_list(value, target_length):
     """Convert various inputs to list of integers"""
+    # Fast path: already a list of ints, returned without copying
+    if type(value) is list and all(type(x) is int for x in value):
+        return value
     if value is None or value == "":
         return None
     
     if isinstance(value, str):
+        stripped = value.strip()
         # Handle JSON array: "[300, 301]"
-        if value.strip().startswith('[') and value.strip().endswith(']'):
+        if stripped[:1] == '[' and stripped[-1:] == ']':
             try:
-                int_list = json.loads(value)
+                int_list = _loads(stripped)
                 return [int(x) for x in int_list]
             except (json.JSONDecodeError, ValueError):
                 raise ValueError(f"Invalid JSON integer array: {value}")
         # Handle single value: "300" -> [300, 300, ...] (applied to all systems)
         try:
-            single_int = int(value.strip())
+            single_int = int(stripped)
             return [single_int] * target_length
         except ValueError:
             raise ValueError(f"Invalid integer: {value}")
@@ -740,14 +1667,18 @@ def normalize_to_int_list(value, target_length):
 
 def normalize_to_nested_list(value, target_length):
     """Convert various inputs to list of string lists"""
+    # Fast path: already one list of node IDs per binding
+    if type(value) is list and value and type(value[0]) is list:
+        return value
     if value is None or value == "":
         return [[] for _ in range(target_length)]  # Default empty lists
     
     if isinstance(value, str):
+        stripped = value.strip()
         # Handle nested JSON: '[["node1"], ["node2", "node3"]]'
-        if value.strip().startswith('['):
+        if stripped[:1] == '[':
             try:
-                parsed = json.loads(value)
+                parsed = _loads(stripped)
                 if all(isinstance(item, list) for item in parsed):
                     return parsed  # Already nested
                 else:
@@ -756,7 +1687,7 @@ def normalize_to_nested_list(value, target_length):
             except json.JSONDecodeError:
                 raise ValueError(f"Invalid JSON for nested list: {value}")
         # Handle single value: "node1" -> [["node1"], ["node1"], ...]
-        return [[value.strip()]] * target_length
+        return [[stripped]] * target_length
     
     if isinstance(value, list):
         if len(value) > 0 and isinstance(value[0], list):
@@ -766,7 +1697,106 @@ def normalize_to_nested_list(value, target_length):
     
     return [[] for _ in range(target_length)]
 
+# Required fields from working API call, identical for every virtual network.
+# Shared by all configs, so they must not be mutated.
+_VN_FIXED_FIELDS = {
+    "vn_id": None,
+    "vni_ids": [],
+    "rt_policy": {"import_RTs": None, "export_RTs": None},
+    "reserved_vlan_id": None,
+    "ipv6_subnet": None,
+    "virtual_gateway_ipv6": None
+}
+
+# Build the virtual_networks entry for the batch API
+def _build_vn_config(security_zone_id, vn_name, virtual_gateway_ipv4, ipv4_subnet, expand_leafs,
+                     system_ids=None, vlan_ids=None, access_switch_node_ids=None,
+                     svi_ips=None, vn_type="vxlan", ipv4_enabled=True,
+                     dhcp_service="dhcpServiceDisabled", virtual_gateway_ipv4_enabled=True,
+                     create_policy_tagged=None, virtual_gateway_ipv6_enabled=False, ipv6_enabled=False):
+    """
+    Normalize create_vn() arguments into one virtual network config.
+    expand_leafs maps system IDs to individual leaf IDs for the auto-generated svi_ips.
+    """
+    # Validate vn_type parameter
+    if vn_type not in ["vxlan", "vlan"]:
+        raise ValueError("vn_type must be either 'vxlan' or 'vlan'")
+    
+    # Normalize system_ids using helper function
+    normalized_system_ids = normalize_to_string_list(system_ids) if system_ids is not None else None
+    
+    # Normalize vlan_ids and access_switch_node_ids
+    if normalized_system_ids:
+        target_length = len(normalized_system_ids)
+        normalized_vlan_ids = normalize_to_int_list(vlan_ids, target_length) if vlan_ids is not None else None
+        normalized_access_switches = normalize_to_nested_list(access_switch_node_ids, target_length)
+    else:
+        normalized_vlan_ids = None
+        normalized_access_switches = None
+    
+    # Build bound_to list if system_ids provided
+    bound_to = []
+    if normalized_system_ids:
+        access_switches = normalized_access_switches or [[]] * target_length
+        if len(access_switches) < target_length:
+            raise ValueError("access_switch_node_ids must have an entry for each system_id")
+        bound_to = [
+            {"system_id": system_id, "access_switch_node_ids": access_ids}
+            for system_id, access_ids in zip(normalized_system_ids, access_switches)
+        ]
+        # A shorter vlan_ids list leaves the remaining bindings without a VLAN
+        for binding, vlan_id in zip(bound_to, normalized_vlan_ids or ()):
+            binding["vlan_id"] = vlan_id
+    
+    # Auto-generate svi_ips if not provided but system_ids are
+    if svi_ips is None and normalized_system_ids:
+        # Get individual leaf IDs for SVI IPs (expand redundancy groups)
+        individual_leaf_ids = expand_leafs(normalized_system_ids)
+        
+        ipv4_mode = "enabled" if ipv4_enabled else "disabled"
+        ipv6_mode = "enabled" if ipv6_enabled else "disabled"
+        svi_ips = [
+            {"system_id": leaf_id, "ipv4_mode": ipv4_mode, "ipv4_addr": None,
+             "ipv6_mode": ipv6_mode, "ipv6_addr": None}
+            for leaf_id in individual_leaf_ids
+        ]
+    elif svi_ips is None:
+        svi_ips = []
+    
+    # Build the complete payload with virtual_networks array wrapper
+    vn_config = {
+        "label": vn_name,
+        "vn_type": vn_type,
+        "security_zone_id": security_zone_id,
+        "virtual_gateway_ipv4": virtual_gateway_ipv4,
+        "ipv4_subnet": ipv4_subnet,
+        "svi_ips": svi_ips,
+        "bound_to": bound_to,
+        "virtual_gateway_ipv4_enabled": virtual_gateway_ipv4_enabled,
+        "ipv4_enabled": ipv4_enabled,
+        "dhcp_service": dhcp_service,
+        "virtual_gateway_ipv6_enabled": virtual_gateway_ipv6_enabled,
+        "ipv6_enabled": ipv6_enabled,
+        **_VN_FIXED_FIELDS
+    }
+    
+    # Add create_policy_tagged only if provided (no default)
+    if create_policy_tagged is not None:
+        vn_config["create_policy_tagged"] = create_policy_tagged
+    
+    return vn_config
+
+# Send virtual network configs to the batch endpoint in one request
+def _post_vn_batch(blueprint_id, vn_configs, server_url=None):
+    # Use the correct batch endpoint with async=full
+    path = _PATH_VN_BATCH.format(blueprint_id)
+    payload = {"virtual_networks": vn_configs}
+    logger.debug("Sending payload to %s: %s", path, payload)
+    response = _request('POST', path, server_url, json=payload)
+    return response.text
+
 # Create virtual networks
+@_error_string
 def create_vn(blueprint_id, security_zone_id, vn_name, virtual_gateway_ipv4, ipv4_subnet,
               system_ids=None, vlan_ids=None, access_switch_node_ids=None,
               svi_ips=None, vn_type="vxlan", ipv4_enabled=True, 
@@ -828,164 +1858,162 @@ def create_vn(blueprint_id, security_zone_id, vn_name, virtual_gateway_ipv4, ipv
         - svi_ips: Auto-expands redundancy groups to individual physical leaf IDs
         - Uses get_system_info() to query blueprint topology and build mapping
     """
-    try:
-        headers, server = auth(server_url)
-        # Use the correct batch endpoint with async=full
-        url = f'https://{server}/api/blueprints/{blueprint_id}/virtual-networks-batch?async=full'
-        
-        # Validate vn_type parameter
-        if vn_type not in ["vxlan", "vlan"]:
-            raise ValueError("vn_type must be either 'vxlan' or 'vlan'")
-        
-        # Normalize system_ids using helper function
-        normalized_system_ids = normalize_to_string_list(system_ids) if system_ids is not None else None
-        
-        # Normalize vlan_ids and access_switch_node_ids
-        if normalized_system_ids:
-            target_length = len(normalized_system_ids)
-            normalized_vlan_ids = normalize_to_int_list(vlan_ids, target_length) if vlan_ids is not None else None
-            normalized_access_switches = normalize_to_nested_list(access_switch_node_ids, target_length)
+    vn_config = _build_vn_config(
+        security_zone_id, vn_name, virtual_gateway_ipv4, ipv4_subnet,
+        lambda ids: get_individual_leafs_from_system_ids(blueprint_id, ids, server_url),
+        system_ids=system_ids, vlan_ids=vlan_ids, access_switch_node_ids=access_switch_node_ids,
+        svi_ips=svi_ips, vn_type=vn_type, ipv4_enabled=ipv4_enabled, dhcp_service=dhcp_service,
+        virtual_gateway_ipv4_enabled=virtual_gateway_ipv4_enabled,
+        create_policy_tagged=create_policy_tagged,
+        virtual_gateway_ipv6_enabled=virtual_gateway_ipv6_enabled, ipv6_enabled=ipv6_enabled)
+    
+    # Wrap in virtual_networks array as required by batch API
+    return _post_vn_batch(blueprint_id, [vn_config], server_url)
+
+# Create several virtual networks in one batch request
+@_error_string
+def create_vns(blueprint_id, vns, server_url=None):
+    """
+    Create several virtual networks with a single virtual-networks-batch request.
+    
+    Unlike create_vn_bulk(), which sends one request per VN, the whole list is
+    accepted or rejected by Apstra as one batch. System info for svi_ips leaf
+    expansion is fetched at most once for the batch.
+    
+    Args:
+        blueprint_id: Blueprint ID
+        vns: List of dicts with create_vn() keyword arguments (security_zone_id,
+             vn_name, virtual_gateway_ipv4, ipv4_subnet and optional fields),
+             or the same list as a JSON string
+        server_url: Optional server URL override
+    
+    Returns:
+        JSON string containing the API response
+    """
+    if isinstance(vns, str):
+        try:
+            vns = _loads(vns)
+        except json.JSONDecodeError:
+            raise ValueError("vns string must be valid JSON")
+    if not isinstance(vns, list):
+        raise ValueError("vns must be a list of virtual network objects")
+    
+    def expand_leafs(system_ids):
+        return get_individual_leafs_from_system_ids(blueprint_id, system_ids, server_url)
+    
+    vn_configs = [_build_vn_config(expand_leafs=expand_leafs, **vn) for vn in vns]
+    return _post_vn_batch(blueprint_id, vn_configs, server_url)
+
+# Create many virtual networks concurrently
+@_error_string
+async def create_vn_bulk_async(blueprint_id, vns, server_url=None):
+    """
+    Create several virtual networks concurrently, one batch request per VN.
+    
+    System info is fetched at most once for the auto-generated svi_ips, and the
+    number of requests in flight is capped by the module concurrency gate.
+    
+    Args:
+        blueprint_id: Blueprint ID
+        vns: List of dicts with create_vn() keyword arguments (security_zone_id,
+             vn_name, virtual_gateway_ipv4, ipv4_subnet and optional fields)
+        server_url: Optional server URL override
+    
+    Returns:
+        JSON string with one entry per VN, in input order. A VN that failed
+        holds {"error": "..."} instead of the API response.
+    """
+    await auth_async(server_url)
+    path = _PATH_VN_BATCH.format(blueprint_id)
+    
+    systems = None
+    if any(vn.get('system_ids') and vn.get('svi_ips') is None for vn in vns):
+        try:
+            systems = _cached_systems(blueprint_id, server_url)
+            if systems is None:
+                response = await _request_async('GET', _PATH_SYSTEM_INFO.format(blueprint_id), server_url)
+                systems = _loads(response.content)['data']
+                _store_systems(blueprint_id, systems, server_url)
+        except Exception as e:
+            logger.error(f"Failed to fetch system info for leaf expansion: {e}")
+    
+    def expand_leafs(system_ids):
+        # Fallback: use original system_ids, as get_individual_leafs_from_system_ids() does
+        return expand_leafs_from_systems(systems, system_ids) if systems is not None else system_ids
+    
+    async def create(vn):
+        payload = {"virtual_networks": [_build_vn_config(expand_leafs=expand_leafs, **vn)]}
+        logger.debug("Sending payload to %s: %s", path, payload)
+        response = await _request_async('POST', path, server_url, json=payload)
+        return _loads(response.content)
+    
+    results = await asyncio.gather(*(create(vn) for vn in vns), return_exceptions=True)
+    output = []
+    for vn, result in zip(vns, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to create virtual network {vn.get('vn_name')}: {result}")
+            output.append({"error": f"{_ERROR_PREFIX}: {result}"})
         else:
-            normalized_vlan_ids = None
-            normalized_access_switches = None
-        
-        # Build bound_to list if system_ids provided
-        bound_to = []
-        if normalized_system_ids:
-            for i, system_id in enumerate(normalized_system_ids):
-                binding = {
-                    "system_id": system_id,
-                    "access_switch_node_ids": normalized_access_switches[i] if normalized_access_switches else []
-                }
-                if normalized_vlan_ids and i < len(normalized_vlan_ids):
-                    binding["vlan_id"] = normalized_vlan_ids[i]
-                bound_to.append(binding)
-        
-        # Auto-generate svi_ips if not provided but system_ids are
-        if svi_ips is None and normalized_system_ids:
-            # Get individual leaf IDs for SVI IPs (expand redundancy groups)
-            individual_leaf_ids = get_individual_leafs_from_system_ids(blueprint_id, normalized_system_ids, server_url)
-            
-            svi_ips = []
-            for leaf_id in individual_leaf_ids:
-                svi_ips.append({
-                    "system_id": leaf_id,
-                    "ipv4_mode": "enabled" if ipv4_enabled else "disabled",
-                    "ipv4_addr": None,
-                    "ipv6_mode": "enabled" if ipv6_enabled else "disabled",
-                    "ipv6_addr": None
-                })
-        elif svi_ips is None:
-            svi_ips = []
-        
-        # Build the complete payload with virtual_networks array wrapper
-        vn_config = {
-            "label": vn_name,
-            "vn_type": vn_type,
-            "security_zone_id": security_zone_id,
-            "virtual_gateway_ipv4": virtual_gateway_ipv4,
-            "ipv4_subnet": ipv4_subnet,
-            "svi_ips": svi_ips,
-            "bound_to": bound_to,
-            "virtual_gateway_ipv4_enabled": virtual_gateway_ipv4_enabled,
-            "ipv4_enabled": ipv4_enabled,
-            "dhcp_service": dhcp_service,
-            "virtual_gateway_ipv6_enabled": virtual_gateway_ipv6_enabled,
-            "ipv6_enabled": ipv6_enabled,
-            # Required fields from working API call
-            "vn_id": None,
-            "vni_ids": [],
-            "rt_policy": {"import_RTs": None, "export_RTs": None},
-            "reserved_vlan_id": None,
-            "ipv6_subnet": None,
-            "virtual_gateway_ipv6": None
-        }
-        
-        # Add create_policy_tagged only if provided (no default)
-        if create_policy_tagged is not None:
-            vn_config["create_policy_tagged"] = create_policy_tagged
-        
-        # Wrap in virtual_networks array as required by batch API
-        payload = {
-            "virtual_networks": [vn_config]
-        }
-        
-        data = json.dumps(payload)
-        logger.info(f"Sending payload to {url}: {data}")
-        response = httpx.post(url, data=data, headers=headers, verify=False, timeout=30.0)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+            output.append(result)
+    return _dumps(output)
+
+def create_vn_bulk(blueprint_id, vns, server_url=None):
+    """Sync wrapper for create_vn_bulk_async(); must not be called from a running event loop"""
+    return _run_sync(create_vn_bulk_async(blueprint_id, vns, server_url))
 
 # Create remote gateways
+@_error_string
 def create_remote_gw(blueprint_id, gw_ip, gw_asn, gw_name, local_gw_nodes, evpn_route_types="all", password=None, keepalive_timer=10, evpn_interconnect_group_id=None, holdtime_timer=30, ttl=30, server_url=None):
     """Creates a remote gateway in a given blueprint. Remote EVPN Gateway is a logical function that you could instantiate anywhere and on any device. 
     It requires BGP support in general, L2VPN/EVPN AFI/SAFI specifically. To establish a BGP session with an EVPN gateway, IP connectivity, 
     as well as connectivity to TCP port 179 (IANA allocates BGP TCP ports), should be available."""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}/remote_gateways'
-        payload = {
-            "gw_name": gw_name,
-            "gw_ip": gw_ip,
-            "gw_asn": gw_asn,
-            "evpn_route_types": evpn_route_types,
-            "local_gw_nodes": local_gw_nodes if isinstance(local_gw_nodes, list) else [local_gw_nodes]
-        }
-        
-        # Add optional parameters only if they are provided
-        if password is not None:
-            payload["password"] = password
-        if evpn_interconnect_group_id is not None:
-            payload["evpn_interconnect_group_id"] = evpn_interconnect_group_id
-            
-        # Add optional parameters with their default values
-        payload["keepalive_timer"] = keepalive_timer
-        payload["holdtime_timer"] = holdtime_timer
-        payload["ttl"] = ttl
-        data = json.dumps(payload)
-        response = httpx.post(url, data=data, headers=headers, verify=False, timeout=30.0)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    # Lists and tuples are sent as JSON arrays; anything else is a single node ID
+    nodes = list(local_gw_nodes) if isinstance(local_gw_nodes, (list, tuple)) else [local_gw_nodes]
+    payload = {
+        "gw_name": gw_name,
+        "gw_ip": gw_ip,
+        "gw_asn": gw_asn,
+        "evpn_route_types": evpn_route_types,
+        "local_gw_nodes": nodes,
+        # Optional parameters with their default values
+        "keepalive_timer": keepalive_timer,
+        "holdtime_timer": holdtime_timer,
+        "ttl": ttl
+    }
+    
+    # Add optional parameters only if they are provided
+    if password is not None:
+        payload["password"] = password
+    if evpn_interconnect_group_id is not None:
+        payload["evpn_interconnect_group_id"] = evpn_interconnect_group_id
+    response = _request('POST', _PATH_REMOTE_GW.format(blueprint_id), server_url, json=payload)
+    return response.text
 
 # Create datacenter blueprint
+@_error_string
 def create_datacenter_blueprint(blueprint_name, template_id, server_url=None):
     """Creates a new datacenter blueprint with the specified name and template"""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints'
-        data = f'{{"design":"two_stage_l3clos","init_type":"template_reference","template_id":"{template_id}","label":"{blueprint_name}"}}'
-        response = httpx.post(url, data=data, headers=headers, verify=False, timeout=30.0)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    payload = {
+        "design": "two_stage_l3clos",
+        "init_type": "template_reference",
+        "template_id": template_id,
+        "label": blueprint_name
+    }
+    response = _request('POST', _PATH_BLUEPRINTS, server_url, json=payload)
+    invalidate_cache('get_bp')
+    return response.text
 
 # Create freeform blueprint
+@_error_string
 def create_freeform_blueprint(blueprint_name, server_url=None):
     """Creates a new freeform blueprint with the specified name"""
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints'
-        data = f'{{"design":"freeform","init_type":"none","label":"{blueprint_name}"}}'
-        response = httpx.post(url, data=data, headers=headers, verify=False, timeout=30.0)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    payload = {"design": "freeform", "init_type": "none", "label": blueprint_name}
+    response = _request('POST', _PATH_BLUEPRINTS, server_url, json=payload)
+    invalidate_cache('get_bp')
+    return response.text
 
 # Apply connectivity template policies to application endpoints
+@_error_string
 def apply_ct_policies(blueprint_id, application_points, server_url=None):
     """Apply connectivity template policies to application endpoints using batch policy API
     
@@ -1029,60 +2057,50 @@ def apply_ct_policies(blueprint_id, application_points, server_url=None):
             }
         ]
     """
-    try:
-        headers, server = auth(server_url)
-        url = f'https://{server}/api/blueprints/{blueprint_id}/obj-policy-batch-apply?async=full'
-        
-        # Normalize application_points to list of dicts
-        if isinstance(application_points, str):
-            try:
-                # Try to parse as JSON
-                normalized_points = json.loads(application_points)
-            except json.JSONDecodeError:
-                raise ValueError("application_points string must be valid JSON")
-        elif isinstance(application_points, dict):
-            # Single dict, convert to list
-            normalized_points = [application_points]
-        elif isinstance(application_points, list):
-            normalized_points = application_points
-        else:
-            raise ValueError("application_points must be a string, dict, or list")
-        
-        # Validate structure
-        if not isinstance(normalized_points, list):
-            raise ValueError("application_points must be a list after normalization")
-            
-        for point in normalized_points:
-            if not isinstance(point, dict):
-                raise ValueError("Each application point must be a dictionary")
-            if "id" not in point:
-                raise ValueError("Each application point must have an 'id' field")
-            if "policies" not in point or not isinstance(point["policies"], list):
-                raise ValueError("Each application point must have a 'policies' list")
-            for policy in point["policies"]:
-                if not isinstance(policy, dict):
-                    raise ValueError("Each policy must be a dictionary")
-                if "policy" not in policy or "used" not in policy:
-                    raise ValueError("Each policy must have 'policy' and 'used' fields")
-                if not isinstance(policy["used"], bool):
-                    raise ValueError("Policy 'used' field must be a boolean")
-        
-        # Create the payload
-        payload = {
-            "application_points": normalized_points
-        }
-        
-        # Convert to JSON string
-        data = json.dumps(payload)
-        
-        logger.info(f"Applying connectivity template policies to {len(normalized_points)} application point(s)")
-        
-        response = httpx.patch(url, data=data, headers=headers, verify=False, timeout=30.0)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
+    # Normalize application_points to list of dicts
+    if isinstance(application_points, str):
+        try:
+            # Try to parse as JSON
+            normalized_points = _loads(application_points)
+        except json.JSONDecodeError:
+            raise ValueError("application_points string must be valid JSON")
+    elif isinstance(application_points, dict):
+        # Single dict, convert to list
+        normalized_points = [application_points]
+    elif isinstance(application_points, list):
+        normalized_points = application_points
+    else:
+        raise ValueError("application_points must be a string, dict, or list")
+    
+    # Validate structure
+    if not isinstance(normalized_points, list):
+        raise ValueError("application_points must be a list after normalization")
         
-    except Exception as e:
-        error_msg = f"An unexpected error occurred: {e}"
-        logger.error(error_msg)
-        return error_msg
+    # Single pass with one lookup per key; batches can hold thousands of points
+    for point in normalized_points:
+        if not isinstance(point, dict):
+            raise ValueError("Each application point must be a dictionary")
+        if "id" not in point:
+            raise ValueError("Each application point must have an 'id' field")
+        policies = point.get("policies")
+        if not isinstance(policies, list):
+            raise ValueError("Each application point must have a 'policies' list")
+        for policy in policies:
+            if not isinstance(policy, dict):
+                raise ValueError("Each policy must be a dictionary")
+            if "policy" not in policy or "used" not in policy:
+                raise ValueError("Each policy must have 'policy' and 'used' fields")
+            used = policy["used"]
+            if used is not True and used is not False:
+                raise ValueError("Policy 'used' field must be a boolean")
+    
+    # Create the payload
+    payload = {
+        "application_points": normalized_points
+    }
+    
+    logger.info(f"Applying connectivity template policies to {len(normalized_points)} application point(s)")
+    
+    response = _request('PATCH', _PATH_CT_BATCH_APPLY.format(blueprint_id), server_url, json=payload)
+    return response.text
 
@@ -9,6 +9,7 @@ Supports:
 from fastmcp import FastMCP
 import apstra_core
 import argparse
+import asyncio
 import sys
 import signal
 import os
@@ -36,6 +37,8 @@ def parse_args():
 # Global variables
 args = None
 mcp = None
+# Fields of the health() report that do not change while the server runs
+_HEALTH_BASE = None
 
 # Initialize everything
 try:
@@ -46,6 +49,9 @@ try:
     # Initialize Apstra core with config
     apstra_core.initialize_config(args.config_file)
     logger.info("Apstra config initialized")
+    apstra_core.warmup()
+    
+    _HEALTH_BASE = {"status": "healthy", "service": "apstra-mcp", "transport": args.transport}
     
     # Create MCP server instance
     mcp = FastMCP("Apstra MCP Server")
@@ -60,19 +66,13 @@ except Exception as e:
 # =============================================================================
 
 @mcp.tool()
-def health() -> str:
+async def health() -> str:
     """Server health check."""
-    health_info = {
-        "status": "healthy",
-        "service": "apstra-mcp",
-        "transport": args.transport,
-        "timestamp": time.time()
-    }
+    health_info = dict(_HEALTH_BASE, timestamp=time.time())
     
     # Test Apstra connectivity
     try:
-        result = apstra_core.auth()
-        health_info["apstra_connection"] = "OK" if "token" in result else "FAILED"
+        health_info["apstra_connection"] = await asyncio.to_thread(apstra_core.auth_status)
     except Exception as e:
         health_info["apstra_connection"] = f"ERROR: {str(e)}"
     
@@ -84,106 +84,120 @@ def formatting_guidelines() -> str:
     return apstra_core.get_formatting_guidelines()
 
 @mcp.tool()
-def get_bp() -> str:
+async def get_bp() -> str:
     """Get list of all blueprints"""
-    data = apstra_core.get_bp()
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_blueprint_guidelines()
+    data = await apstra_core.get_bp_async()
+    guidelines = apstra_core.BLUEPRINT_GUIDELINES
     return f"{guidelines}\n\n## Blueprint Data:\n{data}"
 
 
 @mcp.tool()
-def get_racks(blueprint_id: str) -> str:
+async def get_racks(blueprint_id: str) -> str:
     """Get all racks in a blueprint"""
-    data = apstra_core.get_racks(blueprint_id)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_device_guidelines()
+    data = await apstra_core.get_racks_async(blueprint_id)
+    guidelines = apstra_core.DEVICE_GUIDELINES
     return f"{guidelines}\n\n## Rack Data:\n{data}"
 
 @mcp.tool()
-def get_rz(blueprint_id: str) -> str:
+async def get_rz(blueprint_id: str) -> str:
     """Get all routing zones in a blueprint"""
-    data = apstra_core.get_rz(blueprint_id)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_network_guidelines()
+    data = await apstra_core.get_rz_async(blueprint_id)
+    guidelines = apstra_core.NETWORK_GUIDELINES
     return f"{guidelines}\n\n## Routing Zones Data:\n{data}"
 
 @mcp.tool()
-def get_vn(blueprint_id: str) -> str:
+async def get_vn(blueprint_id: str) -> str:
     """Get virtual networks in a blueprint"""
-    data = apstra_core.get_vn(blueprint_id)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_network_guidelines()
+    data = await apstra_core.get_vn_async(blueprint_id)
+    guidelines = apstra_core.NETWORK_GUIDELINES
     return f"{guidelines}\n\n## Virtual Networks Data:\n{data}"
 
 @mcp.tool()
-def get_ct(blueprint_id: str) -> str:
+async def get_ct(blueprint_id: str) -> str:
     """Get connectivity templates in a blueprint"""
-    data = apstra_core.get_ct(blueprint_id)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_network_guidelines()
+    data = await apstra_core.get_ct_async(blueprint_id)
+    guidelines = apstra_core.NETWORK_GUIDELINES
     return f"{guidelines}\n\n## Connectivity Templates Data:\n{data}"
 
 @mcp.tool()
-def get_app_ep(blueprint_id: str) -> str:
+async def get_app_ep(blueprint_id: str) -> str:
     """Get application endpoints for connectivity templates in a blueprint"""
-    data = apstra_core.get_app_ep(blueprint_id)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_network_guidelines()
+    data = await asyncio.to_thread(apstra_core.get_app_ep, blueprint_id)
+    guidelines = apstra_core.NETWORK_GUIDELINES
     return f"{guidelines}\n\n## Application endpoints Data:\n{data}"
 
 @mcp.tool()
-def get_remote_gw(blueprint_id: str) -> str:
+async def get_remote_gw(blueprint_id: str) -> str:
     """Get all remote gateways in a blueprint"""
-    data = apstra_core.get_remote_gw(blueprint_id)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_network_guidelines()
+    data = await apstra_core.get_remote_gw_async(blueprint_id)
+    guidelines = apstra_core.NETWORK_GUIDELINES
     return f"{guidelines}\n\n## Remote Gateways Data:\n{data}"
 
 @mcp.tool()
-def get_system_info(blueprint_id: str) -> str:
+async def get_system_info(blueprint_id: str) -> str:
     """Get systems (devices) in a blueprint"""
-    data = apstra_core.get_system_info(blueprint_id)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_device_guidelines()
+    data = await apstra_core.get_system_info_async(blueprint_id)
+    guidelines = apstra_core.DEVICE_GUIDELINES
     return f"{guidelines}\n\n## System Information Data:\n{data}"
 
 @mcp.tool()
-def get_anomalies(blueprint_id: str) -> str:
+async def get_anomalies(blueprint_id: str) -> str:
     """Get anomalies in a blueprint"""
-    data = apstra_core.get_anomalies(blueprint_id)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_anomaly_guidelines()
+    data = await apstra_core.get_anomalies_async(blueprint_id)
+    guidelines = apstra_core.ANOMALY_GUIDELINES
     return f"{guidelines}\n\n## Anomaly Data:\n{data}"
 
 @mcp.tool()
-def get_diff_status(blueprint_id: str) -> str:
+async def get_diff_status(blueprint_id: str) -> str:
     """Get configuration diff status for a blueprint"""
-    data = apstra_core.get_diff_status(blueprint_id)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_status_guidelines()
+    data = await apstra_core.get_diff_status_async(blueprint_id)
+    guidelines = apstra_core.STATUS_GUIDELINES
     return f"{guidelines}\n\n## Configuration Diff Status:\n{data}"
 
 @mcp.tool()
-def get_templates() -> str:
+async def get_templates() -> str:
     """Get list of all available templates"""
-    data = apstra_core.get_templates()
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_blueprint_guidelines()
+    data = await apstra_core.get_templates_async()
+    guidelines = apstra_core.BLUEPRINT_GUIDELINES
     return f"{guidelines}\n\n## Templates Data:\n{data}"
 
 @mcp.tool()
-def get_protocol_sessions(blueprint_id: str) -> str:
+async def get_protocol_sessions(blueprint_id: str) -> str:
     """Get protocol sessions in a blueprint"""
-    data = apstra_core.get_protocol_sessions(blueprint_id)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_status_guidelines()
+    data = await apstra_core.get_protocol_sessions_async(blueprint_id)
+    guidelines = apstra_core.STATUS_GUIDELINES
     return f"{guidelines}\n\n## Protocol Sessions Data:\n{data}"
 
+@mcp.tool()
+async def get_blueprint_bundle(blueprint_id: str) -> str:
+    """Get racks, routing zones, virtual networks, systems and anomalies of a blueprint in one call"""
+    data = await apstra_core.get_blueprint_bundle_async(blueprint_id)
+    guidelines = apstra_core.BLUEPRINT_GUIDELINES
+    return f"{guidelines}\n\n## Blueprint Bundle Data:\n{data}"
+
+@mcp.tool()
+async def verify_deployment(blueprint_id: str) -> str:
+    """Get diff status, anomalies and protocol sessions of a blueprint in one call, to verify a deployment"""
+    data = await apstra_core.verify_deployment_async(blueprint_id)
+    guidelines = apstra_core.STATUS_GUIDELINES
+    return f"{guidelines}\n\n## Deployment Verification Data:\n{data}"
+
 # =============================================================================
 # MCP TOOL DEFINITIONS - MANAGEMENT OPERATIONS
 # =============================================================================
 
 @mcp.tool()
-def deploy(blueprint_id: str, description: str, staging_version: int) -> str:
+async def deploy(blueprint_id: str, description: str, staging_version: int) -> str:
     """Deploy blueprint configuration"""
-    data = apstra_core.deploy(blueprint_id, description, staging_version)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_change_mgmt_guidelines()
+    data = await asyncio.to_thread(apstra_core.deploy, blueprint_id, description, staging_version)
+    guidelines = apstra_core.CHANGE_MGMT_GUIDELINES
     return f"{guidelines}\n\n## Deployment Result:\n{data}"
 
 @mcp.tool()
-def delete_blueprint(blueprint_id: str) -> str:
+async def delete_blueprint(blueprint_id: str) -> str:
     """Delete a blueprint"""
-    data = apstra_core.delete_blueprint(blueprint_id)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_change_mgmt_guidelines()
+    data = await asyncio.to_thread(apstra_core.delete_blueprint, blueprint_id)
+    guidelines = apstra_core.CHANGE_MGMT_GUIDELINES
     return f"{guidelines}\n\n## Deletion Result:\n{data}"
 
 # =============================================================================
@@ -191,7 +205,7 @@ def delete_blueprint(blueprint_id: str) -> str:
 # =============================================================================
 
 @mcp.tool()
-def create_vn(blueprint_id: str, security_zone_id: str, vn_name: str, 
+async def create_vn(blueprint_id: str, security_zone_id: str, vn_name: str, 
               virtual_gateway_ipv4: str, ipv4_subnet: str,
               system_ids: Optional[str] = None, 
               vlan_ids: Optional[str] = None, 
@@ -351,38 +365,55 @@ def create_vn(blueprint_id: str, security_zone_id: str, vn_name: str,
     normalized_virtual_gateway_ipv6_enabled = normalize_boolean(virtual_gateway_ipv6_enabled)
     normalized_ipv6_enabled = normalize_boolean(ipv6_enabled)
     
-    data = apstra_core.create_vn(blueprint_id, security_zone_id, vn_name, 
-                                virtual_gateway_ipv4, ipv4_subnet,
-                                system_ids, vlan_ids, access_switch_node_ids,
-                                parsed_svi_ips, vn_type, normalized_ipv4_enabled, 
-                                dhcp_service, normalized_virtual_gateway_ipv4_enabled,
-                                normalized_create_policy_tagged, normalized_virtual_gateway_ipv6_enabled, normalized_ipv6_enabled)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_change_mgmt_guidelines()
+    data = await asyncio.to_thread(apstra_core.create_vn, blueprint_id, security_zone_id, vn_name,
+                                   virtual_gateway_ipv4, ipv4_subnet,
+                                   system_ids, vlan_ids, access_switch_node_ids,
+                                   parsed_svi_ips, vn_type, normalized_ipv4_enabled,
+                                   dhcp_service, normalized_virtual_gateway_ipv4_enabled,
+                                   normalized_create_policy_tagged, normalized_virtual_gateway_ipv6_enabled, normalized_ipv6_enabled)
+    guidelines = apstra_core.CHANGE_MGMT_GUIDELINES
     return f"{guidelines}\n\n## Virtual Network Creation Result:\n{data}"
 
 @mcp.tool()
-def create_remote_gw(blueprint_id: str, gw_ip: str, gw_asn: int, gw_name: str, local_gw_nodes: list, evpn_route_types: str = "all", password: Optional[str] = None, keepalive_timer: int = 10, evpn_interconnect_group_id: Optional[str] = None, holdtime_timer: int = 30, ttl: int = 30) -> str:
+async def create_vns(blueprint_id: str, vns: str) -> str:
+    """Create several virtual networks in one virtual-networks-batch request
+    
+    Args:
+        blueprint_id: The blueprint ID where the VNs will be created (MANDATORY)
+        vns: JSON array of VN objects, each with the create_vn fields (MANDATORY):
+             '[{"security_zone_id": "zone-1", "vn_name": "vn_a", "virtual_gateway_ipv4": "10.1.1.1",
+                "ipv4_subnet": "10.1.1.0/24", "system_ids": ["leaf_pair_id"], "vlan_ids": 300}, ...]'
+    
+    Returns:
+        JSON string with the batch creation result and change management guidelines
+    """
+    data = await asyncio.to_thread(apstra_core.create_vns, blueprint_id, vns)
+    guidelines = apstra_core.CHANGE_MGMT_GUIDELINES
+    return f"{guidelines}\n\n## Virtual Network Batch Creation Result:\n{data}"
+
+@mcp.tool()
+async def create_remote_gw(blueprint_id: str, gw_ip: str, gw_asn: int, gw_name: str, local_gw_nodes: list, evpn_route_types: str = "all", password: Optional[str] = None, keepalive_timer: int = 10, evpn_interconnect_group_id: Optional[str] = None, holdtime_timer: int = 30, ttl: int = 30) -> str:
     """Create a remote EVPN gateway"""
-    data = apstra_core.create_remote_gw(blueprint_id, gw_ip, gw_asn, gw_name, local_gw_nodes, evpn_route_types, password, keepalive_timer, evpn_interconnect_group_id, holdtime_timer, ttl)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_change_mgmt_guidelines()
+    data = await asyncio.to_thread(apstra_core.create_remote_gw, blueprint_id, gw_ip, gw_asn, gw_name, local_gw_nodes, evpn_route_types, password, keepalive_timer, evpn_interconnect_group_id, holdtime_timer, ttl)
+    guidelines = apstra_core.CHANGE_MGMT_GUIDELINES
     return f"{guidelines}\n\n## Remote Gateway Creation Result:\n{data}"
 
 @mcp.tool()
-def create_datacenter_blueprint(blueprint_name: str, template_id: str) -> str:
+async def create_datacenter_blueprint(blueprint_name: str, template_id: str) -> str:
     """Create a new datacenter blueprint from a template"""
-    data = apstra_core.create_datacenter_blueprint(blueprint_name, template_id)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_change_mgmt_guidelines()
+    data = await asyncio.to_thread(apstra_core.create_datacenter_blueprint, blueprint_name, template_id)
+    guidelines = apstra_core.CHANGE_MGMT_GUIDELINES
     return f"{guidelines}\n\n## Blueprint Creation Result:\n{data}"
 
 @mcp.tool()
-def create_freeform_blueprint(blueprint_name: str) -> str:
+async def create_freeform_blueprint(blueprint_name: str) -> str:
     """Create a new freeform blueprint"""
-    data = apstra_core.create_freeform_blueprint(blueprint_name)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_change_mgmt_guidelines()
+    data = await asyncio.to_thread(apstra_core.create_freeform_blueprint, blueprint_name)
+    guidelines = apstra_core.CHANGE_MGMT_GUIDELINES
     return f"{guidelines}\n\n## Blueprint Creation Result:\n{data}"
 
 @mcp.tool()
-def apply_ct_policies(blueprint_id: str, application_points: str) -> str:
+async def apply_ct_policies(blueprint_id: str, application_points: str) -> str:
     """Apply connectivity template policies to application endpoints using batch policy API
     
     This tool applies or removes connectivity template policies from application endpoints (interfaces).
@@ -465,8 +496,8 @@ def apply_ct_policies(blueprint_id: str, application_points: str) -> str:
     Returns:
         JSON string with policy application results and change management guidelines
     """
-    data = apstra_core.apply_ct_policies(blueprint_id, application_points)
-    guidelines = apstra_core.get_base_guidelines() + apstra_core.get_change_mgmt_guidelines()
+    data = await asyncio.to_thread(apstra_core.apply_ct_policies, blueprint_id, application_points)
+    guidelines = apstra_core.CHANGE_MGMT_GUIDELINES
     return f"{guidelines}\n\n## Connectivity Template Policy Application Result:\n{data}"
 
 logger.info("All MCP tools registered")
@@ -2,20 +2,36 @@
 Unit tests for Apstra MCP Server blueprint creation functions
 """
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import sys
 import os
+import json
+import asyncio
+import tempfile
 
 # Add parent directory to path to import the module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import apstra_core
 from apstra_core import (
     auth, get_templates, create_datacenter_blueprint, 
-    create_freeform_blueprint, delete_blueprint, get_bp
+    create_freeform_blueprint, delete_blueprint, get_bp,
+    get_racks_async, get_rz_async, get_blueprint_bundle, get_bp_async
 )
 from tests.test_config import TEST_SERVER, TEST_USERNAME, TEST_PASSWORD
 
 
+def json_response(body, status_code=200):
+    """Build a mock httpx response carrying a JSON body"""
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = body
+    response.text = json.dumps(body)
+    response.content = response.text.encode()
+    response.headers = {}
+    return response
+
+
 class TestApstraMCPUnit(unittest.TestCase):
     """Unit tests for Apstra MCP Server functions"""
     
@@ -24,8 +40,12 @@ class TestApstraMCPUnit(unittest.TestCase):
         self.test_server = TEST_SERVER
         self.test_username = TEST_USERNAME
         self.test_password = TEST_PASSWORD
+        apstra_core._user_sessions.clear()
+        apstra_core._resp_cache.clear()
+        apstra_core._etag_cache.clear()
+        apstra_core._systems_cache.clear()
         
-    @patch('apstra_core.httpx.post')
+    @patch('apstra_core.httpx.Client.post')
     def test_auth_success(self, mock_post):
         """Test successful authentication"""
         # Mock successful response
@@ -43,7 +63,7 @@ class TestApstraMCPUnit(unittest.TestCase):
         self.assertEqual(headers['Content-Type'], 'application/json')
         self.assertEqual(headers['Cache-Control'], 'no-cache')
         
-    @patch('apstra_core.httpx.post')
+    @patch('apstra_core.httpx.Client.post')
     def test_auth_failure(self, mock_post):
         """Test authentication failure"""
         # Mock failed response
@@ -52,71 +72,352 @@ class TestApstraMCPUnit(unittest.TestCase):
         mock_post.return_value = mock_response
         
         # Test authentication failure
-        with self.assertRaises(SystemExit):
+        with self.assertRaises(Exception):
             auth(self.test_server, self.test_username, "wrong-password")
             
-    @patch('apstra_core.auth')
-    @patch('apstra_core.httpx.get')
-    def test_get_templates_success(self, mock_get, mock_auth):
-        """Test successful template retrieval"""
-        # Mock auth and response
-        mock_auth.return_value = ({'AuthToken': 'test-token'}, self.test_server)
+    @patch('apstra_core.httpx.Client.post')
+    def test_auth_token_cached(self, mock_post):
+        """Test that a cached token is reused instead of logging in again"""
         mock_response = Mock()
-        mock_response.json.return_value = {'items': [{'id': 'template1', 'name': 'Template 1'}]}
-        mock_get.return_value = mock_response
+        mock_response.status_code = 201
+        mock_response.json.return_value = {'token': 'test-token-123'}
+        mock_post.return_value = mock_response
+        
+        auth(self.test_server, self.test_username, self.test_password)
+        headers, server = auth(self.test_server, self.test_username, self.test_password)
+        
+        self.assertEqual(headers['AuthToken'], 'test-token-123')
+        mock_post.assert_called_once()
+        
+    @patch('apstra_core.httpx.Client.post')
+    def test_auth_status_reuses_token(self, mock_post):
+        """Test that repeated health checks log in only once"""
+        mock_post.return_value = json_response({'token': 'test-token-123'}, 201)
+        for _ in range(3):
+            self.assertEqual(apstra_core.auth_status(self.test_server), "OK")
+        mock_post.assert_called_once()
+        
+    def test_client_context_manager_closes_pools(self):
+        """Test that leaving the context closes the session's connection pools"""
+        with apstra_core.ApstraClient(self.test_server, self.test_username, self.test_password) as session:
+            self.assertFalse(session._client.is_closed)
+        self.assertTrue(session._client.is_closed)
+        
+        async def use_async():
+            async with apstra_core.ApstraClient(self.test_server, self.test_username, self.test_password) as session:
+                aclient = session._get_aclient()
+            return session, aclient
+        session, aclient = asyncio.run(use_async())
+        self.assertTrue(aclient.is_closed)
+        self.assertTrue(session._client.is_closed)
+        
+    @patch('apstra_core.httpx.Client.post')
+    def test_auth_wrong_password_not_served_from_cache(self, mock_post):
+        """Test that a cached token is not returned for a different password"""
+        mock_post.side_effect = [
+            json_response({'token': 'test-token-123'}, 201),
+            json_response({'errors': 'bad credentials'}, 401),
+        ]
+        auth(self.test_server, self.test_username, self.test_password)
+        with self.assertRaises(Exception):
+            auth(self.test_server, self.test_username, 'WRONG')
+        self.assertEqual(mock_post.call_count, 2)
+        
+    def test_invalidate_auth_for_non_config_user(self):
+        """Test that invalidate_auth finds a non-config user's session without creating one"""
+        session = apstra_core._get_session(self.test_server, 'bob', 'bobpw')
+        session._headers['AuthToken'] = 'bob-token'
+        session._token_expiry = apstra_core.time.monotonic() + 60
+        
+        apstra_core.invalidate_auth(self.test_server, 'bob')
+        self.assertEqual(len(apstra_core._user_sessions), 1)
+        self.assertFalse(session._token_valid())
+        
+    @patch('apstra_core.MAX_SESSIONS', 2)
+    def test_sessions_bounded_lru(self):
+        """Test that the least recently used session is evicted and closed past MAX_SESSIONS"""
+        first = apstra_core._get_session(self.test_server, 'user-a', 'pw')
+        second = apstra_core._get_session(self.test_server, 'user-b', 'pw')
+        self.assertIs(apstra_core._get_session(self.test_server, 'user-a', 'pw'), first)
+        
+        async def open_aclient():
+            return second._get_aclient()
+        loop = asyncio.new_event_loop()
+        try:
+            aclient = loop.run_until_complete(open_aclient())
+            apstra_core._get_session(self.test_server, 'user-c', 'pw')
+        finally:
+            loop.close()
+        
+        users = [key[1] for key in apstra_core._user_sessions]
+        self.assertEqual(users, ['user-a', 'user-c'])
+        # The evicted session's sync and async pools are both closed
+        self.assertTrue(second._client.is_closed)
+        self.assertTrue(aclient.is_closed)
+        
+    def test_config_cached_until_reload(self):
+        """Test that the config file is read once and re-read on reload_config()"""
+        with tempfile.TemporaryDirectory() as tmp:
+            config_file = os.path.join(tmp, 'apstra_config.json')
+            with open(config_file, 'w') as f:
+                json.dump({'server': 'first.example.com', 'username': 'admin'}, f)
+            try:
+                apstra_core.initialize_config(config_file)
+                with open(config_file, 'w') as f:
+                    json.dump({'server': 'second.example.com', 'username': 'admin'}, f)
+                
+                apstra_core.initialize_config(config_file)
+                self.assertEqual(apstra_core.server, 'first.example.com')
+                self.assertEqual(apstra_core.CONFIG.host, 'first.example.com:443')
+                
+                session = apstra_core._get_session()
+                apstra_core._resp_cache[('get_bp', 'first.example.com:443', (), ())] = ('[]', float('inf'))
+                apstra_core.reload_config(config_file)
+                self.assertEqual(apstra_core.server, 'second.example.com')
+                self.assertEqual(len(apstra_core._user_sessions), 0)
+                self.assertEqual(len(apstra_core._resp_cache), 0)
+                self.assertIsNot(apstra_core._get_session(), session)
+                
+                # Cleared config is loaded lazily on first use, not at import
+                apstra_core.CONFIG = None
+                with patch('apstra_core.initialize_config', wraps=apstra_core.initialize_config) as init:
+                    apstra_core._resolve_server('override.example.com:443')
+                    init.assert_not_called()
+                    apstra_core._resolve_server()
+                    init.assert_called_once()
+            finally:
+                apstra_core.initialize_config()
+        
+    def test_concurrent_async_logins_single_flight(self):
+        """Test that concurrent async callers share one login"""
+        session = apstra_core._get_session(self.test_server, self.test_username, self.test_password)
+        
+        async def fake_post(path, **kwargs):
+            await asyncio.sleep(0)
+            return json_response({'token': 'test-token'}, 201)
+        
+        async def login_all():
+            with patch.object(session._get_aclient(), 'post', side_effect=fake_post) as mock_post:
+                await asyncio.gather(*(session.aensure_auth() for _ in range(5)))
+                return mock_post.call_count
+        
+        self.assertEqual(asyncio.run(login_all()), 1)
+        self.assertEqual(session.headers['AuthToken'], 'test-token')
+        
+    @patch('apstra_core.ApstraClient.request')
+    def test_get_bp_cached_until_write(self, mock_request):
+        """Test that blueprint listings are cached and invalidated by writes"""
+        mock_request.return_value = json_response({'items': [{'id': 'bp-1'}]})
+        
+        first = get_bp(self.test_server)
+        second = get_bp(self.test_server)
+        self.assertEqual(first, second)
+        self.assertEqual(mock_request.call_count, 1)
+        
+        delete_blueprint('bp-1', self.test_server)
+        get_bp(self.test_server)
+        self.assertEqual(mock_request.call_count, 3)
+        
+    @patch('apstra_core.httpx.Client.post')
+    @patch('apstra_core.httpx.Client.request')
+    def test_request_reauth_on_401(self, mock_request, mock_post):
+        """Test that a rejected token triggers one re-login and a retried request"""
+        mock_post.return_value = json_response({'token': 'test-token'}, 201)
+        mock_request.side_effect = [json_response({}, 401), json_response({'items': []})]
+        
+        result = get_bp(self.test_server)
+        
+        self.assertEqual(json.loads(result), [])
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_post.call_count, 2)
+            
+    @patch('apstra_core.time.sleep')
+    @patch('apstra_core.httpx.Client.post')
+    @patch('apstra_core.httpx.Client.request')
+    def test_request_retries_transient_errors(self, mock_request, mock_post, mock_sleep):
+        """Test that read timeouts and 503s are retried for GET but not for POST or DELETE"""
+        mock_post.return_value = json_response({'token': 'test-token'}, 201)
+        mock_request.side_effect = [apstra_core.httpx.ReadTimeout("timed out"),
+                                    json_response({'items': []})]
+        
+        self.assertEqual(json.loads(get_bp(self.test_server)), [])
+        self.assertEqual(mock_request.call_count, 2)
+        mock_sleep.assert_called_once()
+        
+        apstra_core.invalidate_cache('get_bp')
+        mock_request.reset_mock()
+        mock_request.side_effect = [json_response({}, 503), json_response({'items': []})]
+        self.assertEqual(json.loads(get_bp(self.test_server)), [])
+        self.assertEqual(mock_request.call_count, 2)
+        
+        mock_request.reset_mock()
+        mock_request.side_effect = apstra_core.httpx.ReadTimeout("timed out")
+        result = create_freeform_blueprint('test-freeform-blueprint', self.test_server)
+        self.assertIn("An unexpected error occurred", result)
+        mock_request.assert_called_once()
+        
+        mock_request.reset_mock()
+        mock_request.side_effect = [json_response({}, 504), json_response({}, 404)]
+        delete_blueprint('bp-1', self.test_server)
+        mock_request.assert_called_once()
+        
+    @patch('apstra_core.ApstraClient.request')
+    def test_fetch_raw_raises_public_getter_returns_string(self, mock_request):
+        """Test that internal fetches raise while public getters return an error string"""
+        mock_request.side_effect = apstra_core.httpx.ConnectError("unreachable")
+        with self.assertRaises(apstra_core.httpx.ConnectError):
+            apstra_core._fetch_raw('GET', '/api/blueprints/bp-1/experience/web/system-info', self.test_server)
+        self.assertIn("An unexpected error occurred", apstra_core.get_system_info('bp-1', self.test_server))
+        self.assertEqual(apstra_core.get_individual_leafs_from_system_ids('bp-1', ['sys-1'], self.test_server),
+                         ['sys-1'])
+        
+    def test_redirect_is_not_success(self):
+        """Test that a 3xx other than 304 is reported as an error, not returned as data"""
+        def handler(request):
+            if request.url.path == '/api/user/login':
+                return apstra_core.httpx.Response(201, json={'token': 'test-token'})
+            return apstra_core.httpx.Response(302, headers={'Location': '/login'})
+        
+        session = apstra_core._get_session(self.test_server)
+        session._client = apstra_core.httpx.Client(base_url=f'https://{self.test_server}',
+                                                   transport=apstra_core.httpx.MockTransport(handler))
+        
+        self.assertIn("An unexpected error occurred", apstra_core.get_rz('bp-1', self.test_server))
+        self.assertIn("An unexpected error occurred", apstra_core.deploy('bp-1', 'test', 1, self.test_server))
+        
+    def test_etag_not_modified_over_transport(self):
+        """Test that a real 304 response is not raised as an error and serves the cached body"""
+        seen = []
+        def handler(request):
+            if request.url.path == '/api/user/login':
+                return apstra_core.httpx.Response(201, json={'token': 'test-token'})
+            seen.append(request.headers.get('If-None-Match'))
+            if request.headers.get('If-None-Match') == '"v1"':
+                return apstra_core.httpx.Response(304)
+            return apstra_core.httpx.Response(200, json={'items': {}}, headers={'ETag': '"v1"'})
+        
+        session = apstra_core._get_session(self.test_server)
+        session._client = apstra_core.httpx.Client(base_url=f'https://{self.test_server}',
+                                                   transport=apstra_core.httpx.MockTransport(handler))
+        
+        first = apstra_core.get_rz('bp-1', self.test_server)
+        second = apstra_core.get_rz('bp-1', self.test_server)
+        
+        self.assertEqual(json.loads(first), {'items': {}})
+        self.assertEqual(second, first)
+        self.assertEqual(seen, [None, '"v1"'])
+        
+    def test_etag_not_modified_over_async_transport(self):
+        """Test that the async getters serve a real 304 from the ETag cache"""
+        seen = []
+        def handler(request):
+            if request.url.path == '/api/user/login':
+                return apstra_core.httpx.Response(201, json={'token': 'test-token'})
+            seen.append(request.headers.get('If-None-Match'))
+            if request.headers.get('If-None-Match') == '"v1"':
+                return apstra_core.httpx.Response(304)
+            return apstra_core.httpx.Response(200, json={'items': {}}, headers={'ETag': '"v1"'})
+        
+        async def run():
+            first = await get_rz_async('bp-1', self.test_server)
+            second = await get_rz_async('bp-1', self.test_server)
+            await apstra_core.aclose()
+            return first, second
+        
+        with patch('apstra_core.httpx.AsyncHTTPTransport',
+                   return_value=apstra_core.httpx.MockTransport(handler)):
+            first, second = asyncio.run(run())
+        
+        self.assertEqual(json.loads(first), {'items': {}})
+        self.assertEqual(second, first)
+        self.assertEqual(seen, [None, '"v1"'])
+        
+    def test_unsolicited_not_modified_is_error(self):
+        """Test that a 304 to a request without If-None-Match is not treated as success"""
+        def handler(request):
+            if request.url.path == '/api/user/login':
+                return apstra_core.httpx.Response(201, json={'token': 'test-token'})
+            return apstra_core.httpx.Response(304)
+        
+        session = apstra_core._get_session(self.test_server)
+        session._client = apstra_core.httpx.Client(base_url=f'https://{self.test_server}',
+                                                   transport=apstra_core.httpx.MockTransport(handler))
+        
+        self.assertIn("An unexpected error occurred", apstra_core.deploy('bp-1', 'test', 1, self.test_server))
+        
+    @patch('apstra_core.ApstraClient.request')
+    def test_get_rz_revalidates_with_etag(self, mock_request):
+        """Test that a 304 for a cached ETag returns the cached body"""
+        first = json_response({'items': {'sz-1': {'label': 'default'}}})
+        first.headers = {'ETag': '"v1"'}
+        not_modified = json_response({}, 304)
+        mock_request.side_effect = [first, not_modified]
+        
+        result1 = apstra_core.get_rz('bp-1', self.test_server)
+        result2 = apstra_core.get_rz('bp-1', self.test_server)
+        
+        self.assertEqual(result1, result2)
+        self.assertNotIn('headers', mock_request.call_args_list[0].kwargs)
+        self.assertEqual(mock_request.call_args_list[1].kwargs['headers'], {'If-None-Match': '"v1"'})
+        
+    @patch('apstra_core.ApstraClient.request')
+    def test_get_templates_success(self, mock_get):
+        """Test successful template retrieval"""
+        # Mock response
+        mock_get.return_value = json_response({'items': [{'id': 'template1', 'name': 'Template 1'}]})
         
         # Test get_templates
         result = get_templates(self.test_server)
         
         # Assertions
-        self.assertIsInstance(result, dict)
+        result = json.loads(result)
         self.assertIn('items', result)
         mock_get.assert_called_once()
         
-    @patch('apstra_core.auth')
-    @patch('apstra_core.httpx.post')
-    def test_create_datacenter_blueprint_success(self, mock_post, mock_auth):
+    @patch('apstra_core.ApstraClient.request')
+    def test_create_datacenter_blueprint_success(self, mock_post):
         """Test successful datacenter blueprint creation"""
-        # Mock auth and response
-        mock_auth.return_value = ({'AuthToken': 'test-token'}, self.test_server)
-        mock_response = Mock()
-        mock_response.json.return_value = {'id': 'bp-123', 'label': 'test-blueprint'}
-        mock_post.return_value = mock_response
+        # Mock response
+        mock_post.return_value = json_response({'id': 'bp-123', 'label': 'test-blueprint'})
         
         # Test create_datacenter_blueprint
         result = create_datacenter_blueprint('test-blueprint', 'template-123', self.test_server)
         
         # Assertions
-        self.assertIsInstance(result, dict)
+        result = json.loads(result)
         self.assertEqual(result['id'], 'bp-123')
         self.assertEqual(result['label'], 'test-blueprint')
         mock_post.assert_called_once()
         
-    @patch('apstra_core.auth')
-    @patch('apstra_core.httpx.post')
-    def test_create_freeform_blueprint_success(self, mock_post, mock_auth):
+    @patch('apstra_core.ApstraClient.request')
+    def test_create_freeform_blueprint_success(self, mock_post):
         """Test successful freeform blueprint creation"""
-        # Mock auth and response
-        mock_auth.return_value = ({'AuthToken': 'test-token'}, self.test_server)
-        mock_response = Mock()
-        mock_response.json.return_value = {'id': 'bp-456', 'label': 'test-freeform-blueprint'}
-        mock_post.return_value = mock_response
+        # Mock response
+        mock_post.return_value = json_response({'id': 'bp-456', 'label': 'test-freeform-blueprint'})
         
         # Test create_freeform_blueprint
         result = create_freeform_blueprint('test-freeform-blueprint', self.test_server)
         
         # Assertions
-        self.assertIsInstance(result, dict)
+        result = json.loads(result)
         self.assertEqual(result['id'], 'bp-456')
         self.assertEqual(result['label'], 'test-freeform-blueprint')
         mock_post.assert_called_once()
         
-    @patch('apstra_core.auth')
-    @patch('apstra_core.httpx.delete')
-    def test_delete_blueprint_success(self, mock_delete, mock_auth):
+    @patch('apstra_core.ApstraClient.request')
+    def test_deploy_payload_escaping(self, mock_request):
+        """Test that request bodies are built from dicts, so quotes are escaped"""
+        mock_request.return_value = json_response({}, 202)
+        
+        apstra_core.deploy('bp-123', 'fix "quoted" \\ description', 5, self.test_server)
+        
+        payload = mock_request.call_args.kwargs['json']
+        self.assertEqual(payload, {'version': 5, 'description': 'fix "quoted" \\ description'})
+        
+    @patch('apstra_core.ApstraClient.request')
+    def test_delete_blueprint_success(self, mock_delete):
         """Test successful blueprint deletion"""
-        # Mock auth and response
-        mock_auth.return_value = ({'AuthToken': 'test-token'}, self.test_server)
+        # Mock response
         mock_response = Mock()
         mock_response.text = ""
         mock_delete.return_value = mock_response
@@ -128,24 +429,231 @@ class TestApstraMCPUnit(unittest.TestCase):
         self.assertEqual(result, "Blueprint deleted successfully")
         mock_delete.assert_called_once()
         
-    @patch('apstra_core.auth')
-    @patch('apstra_core.httpx.get')
-    def test_get_bp_success(self, mock_get, mock_auth):
+    @patch('apstra_core.ApstraClient.request')
+    def test_get_bp_success(self, mock_get):
         """Test successful blueprint listing"""
-        # Mock auth and response
-        mock_auth.return_value = ({'AuthToken': 'test-token'}, self.test_server)
-        mock_response = Mock()
-        mock_response.json.return_value = {'items': [{'id': 'bp-1', 'label': 'Blueprint 1'}]}
-        mock_get.return_value = mock_response
+        # Mock response
+        mock_get.return_value = json_response({'items': [{'id': 'bp-1', 'label': 'Blueprint 1'}]})
         
         # Test get_bp
         result = get_bp(self.test_server)
         
         # Assertions
-        self.assertIsInstance(result, list)
+        result = json.loads(result)
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]['id'], 'bp-1')
         mock_get.assert_called_once()
+        
+    @patch('apstra_core.auth_async', new_callable=AsyncMock)
+    @patch('apstra_core.ApstraClient.arequest', new_callable=AsyncMock)
+    def test_async_getters_gather(self, mock_arequest, mock_auth_async):
+        """Test that async getters can be gathered concurrently"""
+        mock_auth_async.return_value = ({'AuthToken': 'test-token'}, self.test_server)
+        racks = json_response({'items': [{'id': 'rack-1'}]})
+        zones = json_response({'items': {'sz-1': {'label': 'default'}}})
+        mock_arequest.side_effect = [racks, zones]
+        
+        async def fetch():
+            return await asyncio.gather(get_racks_async('bp-1'), get_rz_async('bp-1'))
+        result_racks, result_rz = asyncio.run(fetch())
+        
+        self.assertEqual(json.loads(result_racks)[0]['id'], 'rack-1')
+        self.assertIn('sz-1', json.loads(result_rz)['items'])
+        
+    @patch('apstra_core.auth_async', new_callable=AsyncMock)
+    @patch('apstra_core.ApstraClient.arequest', new_callable=AsyncMock)
+    def test_async_get_bp_shares_sync_cache(self, mock_arequest, mock_auth_async):
+        """Test that the async blueprint listing is cached and invalidated with get_bp"""
+        mock_auth_async.return_value = ({'AuthToken': 'test-token'}, self.test_server)
+        mock_arequest.return_value = json_response({'items': [{'id': 'bp-1'}]})
+        
+        first = asyncio.run(get_bp_async(self.test_server))
+        second = asyncio.run(get_bp_async(self.test_server))
+        self.assertEqual(first, second)
+        self.assertEqual(mock_arequest.await_count, 1)
+        
+        apstra_core.invalidate_cache('get_bp')
+        asyncio.run(get_bp_async(self.test_server))
+        self.assertEqual(mock_arequest.await_count, 2)
+        
+    @patch('apstra_core.ApstraClient.arequest')
+    def test_async_concurrency_gate(self, mock_arequest):
+        """Test that concurrent async requests never exceed the configured limit"""
+        in_flight = 0
+        peak = 0
+        
+        async def fake_request(method, path, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return json_response({'items': []})
+        mock_arequest.side_effect = fake_request
+        
+        apstra_core.set_max_concurrency(2)
+        try:
+            async def fetch():
+                return await asyncio.gather(*(get_racks_async(f'bp-{i}') for i in range(8)))
+            asyncio.run(fetch())
+        finally:
+            apstra_core.set_max_concurrency(4)
+        
+        self.assertEqual(mock_arequest.call_count, 8)
+        self.assertEqual(peak, 2)
+        
+    @patch('apstra_core.auth_async', new_callable=AsyncMock)
+    @patch('apstra_core.ApstraClient.arequest')
+    def test_get_blueprint_bundle(self, mock_arequest, mock_auth_async):
+        """Test that the bundle combines all parts and reports failed parts"""
+        mock_auth_async.return_value = ({'AuthToken': 'test-token'}, self.test_server)
+        
+        async def fake_request(method, path, **kwargs):
+            if path.endswith('/anomalies'):
+                raise Exception("boom")
+            return json_response({'items': [path.rsplit('/', 1)[-1]]})
+        mock_arequest.side_effect = fake_request
+        
+        result = json.loads(get_blueprint_bundle('bp-1'))
+        
+        self.assertEqual(set(result), {'racks', 'rz', 'vn', 'systems', 'anomalies'})
+        self.assertEqual(result['racks'], ['racks'])
+        self.assertEqual(result['vn'], {'items': ['virtual-networks']})
+        self.assertIn('boom', result['anomalies'])
+        mock_auth_async.assert_any_await(None)
+        
+    @patch('apstra_core.auth_async', new_callable=AsyncMock)
+    @patch('apstra_core.ApstraClient.arequest')
+    def test_verify_deployment(self, mock_arequest, mock_auth_async):
+        """Test that deployment verification fetches its three parts concurrently"""
+        async def fake_request(method, path, **kwargs):
+            return json_response({'path': path})
+        mock_arequest.side_effect = fake_request
+        
+        result = json.loads(apstra_core.verify_deployment('bp-1'))
+        
+        self.assertEqual(result['diff_status'], {'path': '/api/blueprints/bp-1/diff-status'})
+        self.assertEqual(result['anomalies'], {'path': '/api/blueprints/bp-1/anomalies'})
+        self.assertEqual(result['protocol_sessions'], {'path': '/api/blueprints/bp-1/protocol-sessions'})
+
+        
+    def test_iter_anomalies_streams_items(self):
+        """Test that the streaming generator yields each anomaly"""
+        def handler(request):
+            if request.url.path == '/api/user/login':
+                return apstra_core.httpx.Response(201, json={'token': 'test-token'})
+            return apstra_core.httpx.Response(200, json={'items': [{'id': 'a-1'}, {'id': 'a-2'}]})
+        
+        session = apstra_core._get_session(self.test_server)
+        session._client = apstra_core.httpx.Client(base_url=f'https://{self.test_server}',
+                                                   transport=apstra_core.httpx.MockTransport(handler))
+        
+        result = list(apstra_core.iter_anomalies('bp-1', self.test_server))
+        
+        self.assertEqual(result, [{'id': 'a-1'}, {'id': 'a-2'}])
+        
+    def test_expand_leafs_from_systems(self):
+        """Test that redundancy groups expand to their member leafs"""
+        systems = [
+            {'id': 'rg-1', 'role': 'redundancy_group'},
+            {'id': 'leaf-1', 'role': 'leaf', 'redundancy_group_id': 'rg-1'},
+            {'id': 'leaf-2', 'role': 'leaf', 'redundancy_group_id': 'rg-1'},
+            {'id': 'leaf-3', 'role': 'leaf'},
+        ]
+        result = apstra_core.expand_leafs_from_systems(systems, ['rg-1', 'leaf-3'])
+        self.assertEqual(result, ['leaf-1', 'leaf-2', 'leaf-3'])
+        
+    def test_nested_list_default_entries_are_independent(self):
+        """Test that the default nested list holds a separate list per binding"""
+        result = apstra_core.normalize_to_nested_list(None, 3)
+        result[0].append('node-1')
+        self.assertEqual(result, [['node-1'], [], []])
+        
+    @patch('apstra_core.ApstraClient.request')
+    def test_leaf_expansion_reuses_system_info(self, mock_request):
+        """Test that repeated leaf expansion fetches system info once until invalidated"""
+        mock_request.return_value = json_response({'data': [
+            {'id': 'rg-1', 'role': 'redundancy_group'},
+            {'id': 'leaf-1', 'role': 'leaf', 'redundancy_group_id': 'rg-1'},
+        ]})
+        for _ in range(3):
+            result = apstra_core.get_individual_leafs_from_system_ids('bp-1', ['rg-1'], self.test_server)
+            self.assertEqual(result, ['leaf-1'])
+        self.assertEqual(mock_request.call_count, 1)
+        
+        apstra_core.invalidate_systems('bp-1', self.test_server)
+        apstra_core.get_individual_leafs_from_system_ids('bp-1', ['rg-1'], self.test_server)
+        self.assertEqual(mock_request.call_count, 2)
+        
+    @patch('apstra_core.ApstraClient.request')
+    def test_create_remote_gw_local_gw_nodes(self, mock_request):
+        """Test that local_gw_nodes lists and tuples are sent as-is and other values wrapped"""
+        mock_request.return_value = json_response({'id': 'gw-1'})
+        for nodes, expected in [(['n1', 'n2'], ['n1', 'n2']), (('n1', 'n2'), ['n1', 'n2']),
+                                ('n1', ['n1']), (None, [None]), ({'id': 'n1'}, [{'id': 'n1'}])]:
+            apstra_core.create_remote_gw('bp-1', '10.0.0.1', 65000, 'gw', nodes,
+                                         server_url=self.test_server)
+            self.assertEqual(mock_request.call_args.kwargs['json']['local_gw_nodes'], expected)
+        
+    @patch('apstra_core.ApstraClient.request')
+    def test_create_vns_single_batch_request(self, mock_request):
+        """Test that create_vns sends all VNs in one batch request"""
+        mock_request.return_value = json_response({'ids': ['vn-a', 'vn-b']})
+        vns = [
+            {'security_zone_id': 'sz-1', 'vn_name': 'vn-a', 'virtual_gateway_ipv4': '10.1.1.1',
+             'ipv4_subnet': '10.1.1.0/24'},
+            {'security_zone_id': 'sz-1', 'vn_name': 'vn-b', 'virtual_gateway_ipv4': '10.1.2.1',
+             'ipv4_subnet': '10.1.2.0/24'},
+        ]
+        result = json.loads(apstra_core.create_vns('bp-1', vns, self.test_server))
+        
+        self.assertEqual(result, {'ids': ['vn-a', 'vn-b']})
+        mock_request.assert_called_once()
+        args, kwargs = mock_request.call_args
+        self.assertEqual(args[0], 'POST')
+        self.assertEqual([vn['label'] for vn in kwargs['json']['virtual_networks']], ['vn-a', 'vn-b'])
+        
+        mock_request.reset_mock()
+        self.assertEqual(json.loads(apstra_core.create_vns('bp-1', json.dumps(vns), self.test_server)),
+                         {'ids': ['vn-a', 'vn-b']})
+        result = apstra_core.create_vns('bp-1', '[{"vn_name": ', self.test_server)
+        self.assertTrue(result.startswith('An unexpected error occurred'))
+        mock_request.assert_called_once()
+        
+    @patch('apstra_core.auth_async', new_callable=AsyncMock)
+    @patch('apstra_core.ApstraClient.arequest')
+    def test_create_vn_bulk(self, mock_arequest, mock_auth_async):
+        """Test that bulk VN creation keeps input order and reports failed items"""
+        systems = {'data': [
+            {'id': 'rg-1', 'role': 'redundancy_group'},
+            {'id': 'leaf-1', 'role': 'leaf', 'redundancy_group_id': 'rg-1'},
+            {'id': 'leaf-2', 'role': 'leaf', 'redundancy_group_id': 'rg-1'},
+        ]}
+        payloads = []
+        
+        async def fake_request(method, path, **kwargs):
+            if method == 'GET':
+                return json_response(systems)
+            vn = kwargs['json']['virtual_networks'][0]
+            if vn['label'] == 'bad':
+                raise Exception("rejected")
+            payloads.append(vn)
+            return json_response({'ids': [vn['label']]})
+        mock_arequest.side_effect = fake_request
+        
+        vns = [
+            {'security_zone_id': 'sz-1', 'vn_name': 'vn-a', 'virtual_gateway_ipv4': '10.1.1.1',
+             'ipv4_subnet': '10.1.1.0/24', 'system_ids': ['rg-1'], 'vlan_ids': 300},
+            {'security_zone_id': 'sz-1', 'vn_name': 'bad', 'virtual_gateway_ipv4': '10.1.2.1',
+             'ipv4_subnet': '10.1.2.0/24'},
+        ]
+        result = json.loads(apstra_core.create_vn_bulk('bp-1', vns))
+        
+        self.assertEqual(result[0], {'ids': ['vn-a']})
+        self.assertIn('rejected', result[1]['error'])
+        self.assertEqual([svi['system_id'] for svi in payloads[0]['svi_ips']], ['leaf-1', 'leaf-2'])
+        self.assertEqual(payloads[0]['bound_to'][0]['vlan_id'], 300)
+        self.assertEqual(sum(1 for c in mock_arequest.call_args_list if c.args[0] == 'GET'), 1)
 
 
 if __name__ == '__main__':